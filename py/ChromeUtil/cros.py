@@ -1,6 +1,7 @@
-#!/usr/bin/envpython
+#!/usr/bin/env python3
 # Chroot Environment setup
 import os
+import shutil
 import subprocess
 import sys
 
@@ -10,70 +11,66 @@ CHROOT = "chroot"
 Current_Path = os.getcwd()
 Tool_Path = Current_Path + "/" + DEPOT_TOOLS
 Chroot_Path = Current_Path + "/" + CHROOT
-ENV_PATH = os.environ["PATH"] + ':' + Tool_Path
-os.environ["PATH"] = ENV_PATH
 
 
 def setup_depot_tool():
-    if not os.path.isdir(Tool_Path):
-        ans = raw_input("depot_tool is not exsit, press 'y' for download depot tool\n")
+    # only offer the clone when no repo is reachable through PATH
+    if not os.path.isdir(Tool_Path) and shutil.which("repo") is None:
+        ans = input("depot_tool is not exsit, press 'y' for download depot tool\n")
         if ans == 'y':
-            print 'Download now .....
+            print('Download now .....')
             subprocess.call(["git", "clone", "https://chromium.googlesource.com/chromium/tools/depot_tools.git"])
         else:
             return -1
 
+    # the local checkout also provides cros_sdk, so add it even when repo was found
+    if os.path.isdir(Tool_Path) and Tool_Path not in os.environ["PATH"].split(os.pathsep):
+        os.environ["PATH"] += os.pathsep + Tool_Path
 
-def help_menu():
-    print 'Usage: chromenv [repo command=n] [code source=n]'
-    print 'Commands:'
-    print '-b : repo init [firmware branch]'
-    print '-s : repo sync'
-    print '-c : cros_sdk'
-    print '-d : cros_sdk --delete'
-    print '-r : cros_sdk --replace'
-    print '-h : help'
 
+def help_menu():
+    print('Usage: chromenv [repo command=n] [code source=n]')
+    print('Commands:')
+    print('-b : repo init [firmware branch]')
+    print('-s : repo sync')
+    print('-c : cros_sdk')
+    print('-d : cros_sdk --delete')
+    print('-r : cros_sdk --replace')
+    print('-h : help')
 
-def cmd_menu(argv):
 
-    for cmd in argv:
-        if cmd == '-b':
-            if len(argv) > 2 and argv[2] != "":
-                branch_name = str(argv[2])
-                subprocess.call(["repo", "init", "-u", "https://chromium.googlesource.com/chromiumos/manifest.git"])
-                subprocess.call(["repo", "init", "-b", "firmware-buddy-6301.202.B"])
-                subprocess.call(["repo", "sync"])
-                break
-            else:
-                ans = raw_input("the branch name is empty, press 'y' to use tot or 'n' to exit\n")
-                if ans == 'y':
-                    subprocess.call(["repo", "init", "-u", "https://chromium.googlesource.com/chromiumos/manifest.git"])
-                    subprocess.call(["repo", "sync"])
-                else:
-                    break
-
-        elif cmd == '-s':
-            subprocess.call(["repo", "sync"])
-            break
-        elif cmd == '-c':
-            subprocess.call(["cros_sdk", "--no-ns-pid"])
-            break
-        elif cmd == '-d':
-            subprocess.call(["cros_sdk", "--delete"])
-            break
-        elif cmd == '-r':
-            subprocess.call(["cros_sdk", "--replace"])
-            break
-        elif cmd == '-n':
-            subprocess.call(["cros_sdk", "--nouse-image"])
-            break
-        elif cmd == '-h':
-            help_menu()
-            break
+def repo_init(argv):
+    if len(argv) > 2 and argv[2] != "":
+        branch_name = str(argv[2])
+        subprocess.call(["repo", "init", "-u", "https://chromium.googlesource.com/chromiumos/manifest.git"])
+        subprocess.call(["repo", "init", "-b", "firmware-buddy-6301.202.B"])
+        subprocess.call(["repo", "sync"])
     else:
-        print "Usage: chromenv [repo command=n] [code source=n] \n"
-        print "Use 'chromenv -h' to print a list of commands"
+        ans = input("the branch name is empty, press 'y' to use tot or 'n' to exit\n")
+        if ans == 'y':
+            subprocess.call(["repo", "init", "-u", "https://chromium.googlesource.com/chromiumos/manifest.git"])
+            subprocess.call(["repo", "sync"])
+
+
+def usage(argv):
+    print("Usage: chromenv [repo command=n] [code source=n] \n")
+    print("Use 'chromenv -h' to print a list of commands")
+
+
+CMD_HANDLERS = {
+    '-b': repo_init,
+    '-s': lambda argv: subprocess.call(["repo", "sync"]),
+    '-c': lambda argv: subprocess.call(["cros_sdk", "--no-ns-pid"]),
+    '-d': lambda argv: subprocess.call(["cros_sdk", "--delete"]),
+    '-r': lambda argv: subprocess.call(["cros_sdk", "--replace"]),
+    '-n': lambda argv: subprocess.call(["cros_sdk", "--nouse-image"]),
+    '-h': lambda argv: help_menu(),
+}
+
+
+def cmd_menu(argv):
+    cmd = argv[1] if len(argv) > 1 else None
+    CMD_HANDLERS.get(cmd, usage)(argv)
 
 
 def main(argv):
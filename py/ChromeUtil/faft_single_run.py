@@ -1,7 +1,9 @@
-#!/usr/bin/env python
-import os
+#!/usr/bin/env python3
+import itertools
 import subprocess 
-import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 SCR="/usr/bin/test_that"
 
@@ -63,21 +65,31 @@ task_list = [
     #"firmware_DevScreenTimeout"
 ]
 
-board=" -b coral"
-ip=" 172.16.40.219"
+board="coral"
+dut_list = [
+    "172.16.40.219",
+]
+
+# one DUT runs one test at a time; tasks only run in parallel across DUTs
+dut_locks = {ip: threading.Lock() for ip in dut_list}
 
 def dut_cleanup():
     subprocess.call(["dut-control", "power_state:reset",])
-    print "Dut reset....."
-    subprocess.call(["sleep", "10",])
+    print("Dut reset.....")
+    time.sleep(10)
 
 
+def run_task(task, ip):
+    with dut_locks[ip]:
+        print("test %s on %s now" % (task, ip))
+        subprocess.run([SCR, "-b", board, ip, task], check=False)
+        dut_cleanup()
+
 
 def main():
     
-    for index in task_list:
-        print "test %s now" %(index)
-        os.system(SCR + board+ ip + " "+index)        
-        dut_cleanup()
+    with ThreadPoolExecutor(max_workers=len(dut_list)) as executor:
+        # spread tasks over the DUTs round-robin, list() re-raises worker errors
+        list(executor.map(run_task, task_list, itertools.cycle(dut_list)))
 
 main()
@@ -3,15 +3,14 @@ import os
 import subprocess
 import sys
 ROOT = "/mnt/host/source/Project/"
-pty_config_file = "./pty_number"
 
-project_list = [
+project_list = frozenset([
 				"nautilus",
 				"coral",
 				"poppy",
 				"setzer",
 				"robo",
-				"nahser"];
+				"nahser"])
 
 def help_menu():
 	print "Usage: [target] [board name] "
@@ -26,44 +25,28 @@ def call_minicom(pty, location):
 
 def get_support_list(argv):
 
-	not_supported = True
-
-	for index in project_list:
-		if index == argv:
-			not_supported = False
-			break
+	not_supported = argv not in project_list
 
 	if (not_supported):
-		board = None
 		print "not supported board"
 
 	return not_supported
 
 def get_uart_type(argv):
 
-	if argv == "ec":
-		not_connection  = os.system("dut-control ec_uart_pty > pty_number")
-		if not_connection:
+	if argv == "ec" or argv == "cpu":
+		try:
+			output = subprocess.check_output(["dut-control", argv + "_uart_pty"])
+		except (subprocess.CalledProcessError, OSError):
 			print "connection fail"
 			return None
 
-		fd = open("pty_number","r")
-		fd.read(len("ec_uart_pty:"))
-		target = fd.readline()
-		os.remove("./pty_number")
-		return target
-
-	if argv == "cpu":
-		not_connection = os.system("dut-control cpu_uart_pty > pty_number")
-		if not_connection:
+		# output looks like "ec_uart_pty:/dev/pts/N"
+		name, separator, target = output.partition(":")
+		if not separator:
 			print "connection fail"
 			return None
-
-		fd = open(pty_config_file, "r")
-		fd.read(len("cpu_uart_pty:"))
-		target = fd.readline()
-		os.remove(pty_config_file)
-		return target
+		return target.strip()
 
 	print "unkonw targe given "
 
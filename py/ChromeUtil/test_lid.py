@@ -1,7 +1,8 @@
 #!/usr/bin/env python
-import os
+import socket
 import subprocess
 import sys
+import time
 
 def lid_off():
     subprocess.call(["dut-control", "lid_open:no",])
@@ -13,12 +14,14 @@ def lid_open():
 
 def check_ping():
     hostname = "172.16.40.221"
-    response = os.system("ping -c 1 " + hostname)
-    # and then check the response...
-    if response == 0:
-        pingstatus = "Network Active"
-    else:
+    # probe the DUT's ssh port directly instead of forking ping
+    try:
+        sock = socket.create_connection((hostname, 22), timeout=1.0)
+    except (socket.error, socket.timeout):
         pingstatus = "Network Error"
+    else:
+        sock.close()
+        pingstatus = "Network Active"
 
     return pingstatus
 
@@ -29,11 +32,11 @@ def main():
 
         lid_off()
 
-        subprocess.call(["sleep", "15",])
+        time.sleep(15)
 
         lid_open()
 
-        subprocess.call(["sleep", "20",])
+        time.sleep(20)
 
         if ("Network Error" == check_ping()):
             break
@@ -106,6 +106,9 @@ PLATFORM_CONFIGS = {
     }
 }
 
+# MEM_MX_DATA_XX labels for every pin value a group can produce
+MEM_DATA_LABELS = tuple(f"MEM_MX_DATA_{value:02d}" for value in range(64))
+
 def read_dqmap_file(file_path):
     """
     Check if a given file exists and read its contents.
@@ -117,12 +120,13 @@ def read_dqmap_file(file_path):
         tuple: (bool, str) - (success status, file contents or error message)
     """
     try:
-        if not os.path.exists(file_path):
+        # Let open() report a missing file instead of stat-ing it first
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                content = file.read()
+        except FileNotFoundError:
             return False, f"Error: File not found at {file_path}"
 
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-
         if not content:
             return False, f"Error: File is empty at {file_path}"
 
@@ -283,53 +287,30 @@ def generate_mem_data_groups(offsets, data_groups):
         data_groups: List of DQ pin mappings for each channel
 
     Returns:
-        List of processed groups with MEM_MX_DATA_XX format
+        List of processed groups with MEM_MX_DATA_XX format, or None if a pin
+        is outside the DQ0-DQ15 range
     """
+    # Pins fold onto 0-7 with a mask, which only holds for DQ0-DQ15
+    a_side_pins = [pin for idx in range(0, 16, 4) for group in data_groups[idx:idx + 2] for pin in group]
+    if not all(0 <= pin < 16 for pin in a_side_pins):
+        logger.error(f"DQ pin numbers must be between 0 and 15: {a_side_pins}")
+        return None
+
     result = []
 
-    # Process each channel (MA, MB, MC, MD)
+    # Process each channel (MA, MB, MC, MD); each group is built in a single
+    # comprehension rather than an append loop per pin
     for channel_idx in range(4):
-        channel_offsets = offsets[channel_idx * 4:(channel_idx + 1) * 4]
-
-        # Process A-side lower byte group
-        a_lower_group = []
-        a_data = data_groups[channel_idx * 4]
-        for dq_idx, pin in enumerate(a_data):
-            offset = channel_offsets[0]
-            value = pin
-            if value >= 8:
-                value -= 8
-            value += offset
-            a_lower_group.append(f"MEM_MX_DATA_{value:02d}")
-        result.append(a_lower_group)
-
-        # Process A-side upper byte group
-        a_upper_group = []
-        a_data = data_groups[channel_idx * 4 + 1]
-        for dq_idx, pin in enumerate(a_data):
-            offset = channel_offsets[1]
-            value = pin
-            if value >= 8:
-                value -= 8
-            value += offset
-            a_upper_group.append(f"MEM_MX_DATA_{value:02d}")
-        result.append(a_upper_group)
-
-        # Process B-side lower byte group
-        b_lower_group = []
-        for dq_idx in range(8):
-            offset = channel_offsets[2]
-            value = dq_idx + offset
-            b_lower_group.append(f"MEM_MX_DATA_{value:02d}")
-        result.append(b_lower_group)
-
-        # Process B-side upper byte group
-        b_upper_group = []
-        for dq_idx in range(8):
-            offset = channel_offsets[3]
-            value = dq_idx + offset
-            b_upper_group.append(f"MEM_MX_DATA_{value:02d}")
-        result.append(b_upper_group)
+        a_lower_offset, a_upper_offset, b_lower_offset, b_upper_offset = \
+            offsets[channel_idx * 4:(channel_idx + 1) * 4]
+
+        # A-side lower and upper byte groups: fold pins 8-15 onto 0-7, then offset
+        result.append([MEM_DATA_LABELS[(pin & 7) + a_lower_offset] for pin in data_groups[channel_idx * 4]])
+        result.append([MEM_DATA_LABELS[(pin & 7) + a_upper_offset] for pin in data_groups[channel_idx * 4 + 1]])
+
+        # B-side lower and upper byte groups map DQ0-7 straight through
+        result.append(list(MEM_DATA_LABELS[b_lower_offset:b_lower_offset + 8]))
+        result.append(list(MEM_DATA_LABELS[b_upper_offset:b_upper_offset + 8]))
 
     return result
 
@@ -1,5 +1,6 @@
 """Configuration management for PostCodeMon."""
 
+import copy
 import os
 import sys
 from pathlib import Path
@@ -9,6 +10,12 @@ import json
 from dataclasses import dataclass, field
 from .errors import ConfigurationError
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 @dataclass
 class ToolConfig:
@@ -22,6 +29,7 @@ class ToolConfig:
     environment_vars: Dict[str, str] = field(default_factory=dict)
     validation_rules: Dict[str, Any] = field(default_factory=dict)
     working_directory: Optional[str] = None
+    version_flag: Optional[str] = None
 
 
 @dataclass 
@@ -54,9 +62,21 @@ class ConfigManager:
     
     CONFIG_FILENAME = "postcodemon.yaml"
     
+    # Environment variables that override configuration values
+    ENV_OVERRIDES = {
+        'POSTCODEMON_LOG_LEVEL': ('logging', 'level'),
+        'POSTCODEMON_LOG_FILE': ('logging', 'file_path'),
+        'POSTCODEMON_TIMEOUT': ('global_timeout',),
+        'POSTCODEMON_MAX_JOBS': ('max_concurrent_jobs',),
+        'POSTCODEMON_TEMP_DIR': ('temp_directory',),
+    }
+    
     def __init__(self, config_path: Optional[Union[str, Path]] = None):
         self.config_path = config_path
         self._config: Optional[WrapperConfig] = None
+        # Last parsed configuration data and the file/env state it came from
+        self._loaded_data: Optional[Dict[str, Any]] = None
+        self._loaded_key: Optional[tuple] = None
         self._config_search_paths = self._get_config_search_paths()
     
     def _get_config_search_paths(self) -> List[Path]:
@@ -91,6 +111,14 @@ class ConfigManager:
         if self._config is not None:
             return self._config
         
+        # Reuse the last parse when no config file or override has changed.
+        # Each load still builds a fresh WrapperConfig from a copy of the
+        # parsed data, so runtime edits to a config never survive a reload.
+        load_key = self._get_load_key()
+        if load_key == self._loaded_key and self._loaded_data is not None:
+            self._config = self._create_config_object(copy.deepcopy(self._loaded_data))
+            return self._config
+        
         # Start with default configuration
         config_data = {}
         
@@ -99,7 +127,7 @@ class ConfigManager:
             if config_path.exists():
                 try:
                     loaded_config = self._load_config_file(config_path)
-                    config_data = self._merge_configs(config_data, loaded_config)
+                    config_data = self._unsafe_merge_configs(config_data, loaded_config)
                 except Exception as e:
                     raise ConfigurationError(
                         f"Failed to load configuration from {config_path}: {e}",
@@ -111,12 +139,26 @@ class ConfigManager:
         
         # Validate and create configuration object
         try:
-            self._config = self._create_config_object(config_data)
+            self._config = self._create_config_object(copy.deepcopy(config_data))
         except Exception as e:
             raise ConfigurationError(f"Invalid configuration: {e}")
         
+        self._loaded_data = config_data
+        self._loaded_key = load_key
         return self._config
     
+    def _get_load_key(self) -> tuple:
+        """Identify the current state of the config files and env overrides."""
+        file_states = []
+        for config_path in self._config_search_paths:
+            try:
+                stat = os.stat(config_path)
+            except OSError:
+                continue
+            file_states.append((str(config_path), stat.st_mtime_ns, stat.st_size))
+        env_values = tuple(os.getenv(env_var) for env_var in self.ENV_OVERRIDES)
+        return (tuple(file_states), env_values)
+    
     def _load_config_file(self, config_path: Path) -> Dict[str, Any]:
         """Load a single configuration file."""
         with open(config_path, 'r', encoding='utf-8') as f:
@@ -129,28 +171,37 @@ class ConfigManager:
     
     def _merge_configs(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
         """Recursively merge configuration dictionaries."""
-        result = base.copy()
+        # Overlay in one shallow unpack, then only descend into keys where both
+        # sides hold a mapping (tools, logging, profiles and their children).
+        result = {**base, **override}
         
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+            if isinstance(value, dict):
+                base_value = base.get(key)
+                if isinstance(base_value, dict):
+                    result[key] = self._merge_configs(base_value, value)
         
         return result
     
+    def _unsafe_merge_configs(self, base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge override into base in place, without copying either side.
+        
+        Only safe when neither dictionary is used again by the caller, as in
+        load_config where each file's data is discarded after merging.
+        """
+        for key, value in override.items():
+            if isinstance(value, dict):
+                base_value = base.get(key)
+                if isinstance(base_value, dict):
+                    self._unsafe_merge_configs(base_value, value)
+                    continue
+            base[key] = value
+        
+        return base
+    
     def _apply_env_overrides(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment variable overrides to configuration."""
-        # Support common environment variable patterns
-        env_mappings = {
-            'POSTCODEMON_LOG_LEVEL': ('logging', 'level'),
-            'POSTCODEMON_LOG_FILE': ('logging', 'file_path'),
-            'POSTCODEMON_TIMEOUT': ('global_timeout',),
-            'POSTCODEMON_MAX_JOBS': ('max_concurrent_jobs',),
-            'POSTCODEMON_TEMP_DIR': ('temp_directory',),
-        }
-        
-        for env_var, config_path in env_mappings.items():
+        for env_var, config_path in self.ENV_OVERRIDES.items():
             value = os.getenv(env_var)
             if value is not None:
                 # Navigate to the nested configuration location
@@ -186,7 +237,8 @@ class ConfigManager:
                     retry_wait_seconds=tool_data.get('retry_wait_seconds', 10),
                     environment_vars=tool_data.get('environment_vars', {}),
                     validation_rules=tool_data.get('validation_rules', {}),
-                    working_directory=tool_data.get('working_directory')
+                    working_directory=tool_data.get('working_directory'),
+                    version_flag=tool_data.get('version_flag')
                 )
         
         # Extract logging configuration
@@ -230,26 +282,23 @@ class ConfigManager:
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Convert configuration to dictionary
-        config_dict = {
-            'tools': {name: {
-                'executable_path': tool.executable_path,
-                'default_args': tool.default_args,
-                'timeout_seconds': tool.timeout_seconds,
-                'retry_attempts': tool.retry_attempts,
-                'environment_vars': tool.environment_vars,
-                'validation_rules': tool.validation_rules,
-                'working_directory': tool.working_directory
-            } for name, tool in config.tools.items()},
-            'logging': {
-                'level': config.logging.level,
-                'format': config.logging.format,
-                'file_path': config.logging.file_path,
-                'max_file_size': config.logging.max_file_size,
-                'backup_count': config.logging.backup_count,
-                'json_format': config.logging.json_format,
-                'remote_endpoint': config.logging.remote_endpoint
+        config_dict = self._config_to_dict(config)
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            yaml.dump(config_dict, f, Dumper=_YamlDumper, default_flow_style=False, indent=2)
+    
+    def _config_to_dict(self, config: WrapperConfig) -> Dict[str, Any]:
+        """Convert configuration to a plain dictionary for serialization.
+        
+        The dataclasses only hold primitives and plain containers, so their
+        field dicts are used directly rather than deep-copied.
+        """
+        return {
+            'tools': {
+                name: {key: value for key, value in vars(tool).items() if key != 'name'}
+                for name, tool in config.tools.items()
             },
+            'logging': dict(vars(config.logging)),
             'profiles': config.profiles,
             'global_timeout': config.global_timeout,
             'max_concurrent_jobs': config.max_concurrent_jobs,
@@ -257,6 +306,3 @@ class ConfigManager:
             'monitoring_enabled': config.monitoring_enabled,
             'metrics_endpoint': config.metrics_endpoint
         }
-        
-        with open(path, 'w', encoding='utf-8') as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2)
\ No newline at end of file
@@ -60,11 +60,12 @@ class PerformanceLogger:
     
     def __enter__(self):
         self.start_time = time.time()
-        self.logger.info(f"Starting {self.operation}", extra={
-            'operation': self.operation,
-            'event': 'start',
-            **self.context
-        })
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"Starting {self.operation}", extra={
+                'operation': self.operation,
+                'event': 'start',
+                **self.context
+            })
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -72,6 +73,8 @@ class PerformanceLogger:
         duration = self.end_time - self.start_time
         
         if exc_type is None:
+            if not self.logger.isEnabledFor(logging.INFO):
+                return
             self.logger.info(f"Completed {self.operation}", extra={
                 'operation': self.operation,
                 'event': 'complete',
@@ -163,6 +166,14 @@ class LogManager:
             self._loggers[name] = logging.getLogger(name)
         return self._loggers[name]
     
+    def is_enabled(self, name: str, level: int = logging.INFO) -> bool:
+        """Check whether a logger would emit records at the given level."""
+        return self.get_logger(name).isEnabledFor(level)
+    
+    def is_audit_enabled(self) -> bool:
+        """Check whether log_audit_event records would be emitted."""
+        return self.is_enabled("postcodemon.audit")
+    
     def get_structured_logger(self, name: str) -> structlog.BoundLogger:
         """Get a structured logger instance."""
         return structlog.get_logger(name)
@@ -1,21 +1,126 @@
 """Process management for executing Windows tools."""
 
 import asyncio
+import copy
 import os
+import queue
+import selectors
 import signal
 import subprocess
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, Future
-from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import psutil
 import sys
+import weakref
 
 from .errors import ToolExecutionError, TimeoutError, ToolNotFoundError
 from .logger import LogManager
 
 
+# Hard cap on concurrent async executions; beyond this extra tools only add contention
+MAX_CONCURRENT_EXECUTIONS = 16
+
+# Number of independently locked shards in the active process table
+PROCESS_TABLE_STRIPES = 8
+
+# Tools that exit sooner than this never get a ProcessMonitor
+MONITOR_START_DELAY = 0.5
+
+# Maximum number of memoized results kept for execute_tool(cache=True)
+RESULT_CACHE_SIZE = 128
+
+# How often waits re-check a caller's cancel_event
+CANCEL_POLL_INTERVAL = 0.1
+
+# Forced on every child so Python tools stream unbuffered UTF-8 output
+_FORCED_CHILD_ENV = {'PYTHONUNBUFFERED': '1', 'PYTHONIOENCODING': 'utf-8'}
+
+
+class _ExecutionCancelled(Exception):
+    """Raised inside ProcessManager when a caller's cancel_event is set."""
+
+
+class ChildEnvironment(dict):
+    """A complete child environment, handed to the process as-is.
+    
+    Built by ProcessManager.build_env. Passing one as env skips the
+    per-spawn os.environ copy that plain override dicts get.
+    """
+
+
+def _decode_output(data: Optional[Union[bytes, bytearray]]) -> str:
+    """Decode captured tool output, tolerating non-UTF-8 bytes."""
+    return data.decode("utf-8", errors="replace") if data else ""
+
+
+def _emit_lines(buf: bytearray, start: int, progress_callback: Callable[[str], None]) -> int:
+    """Pass each complete line in buf[start:] to progress_callback.
+    
+    Returns the offset just past the last newline, i.e. the next start.
+    """
+    newline = buf.find(b"\n", start)
+    while newline != -1:
+        progress_callback(_decode_output(buf[start:newline]).rstrip("\r"))
+        start = newline + 1
+        newline = buf.find(b"\n", start)
+    return start
+
+
+async def _read_stream_aio(stream: asyncio.StreamReader,
+                           progress_callback: Callable[[str], None]) -> str:
+    """Read an asyncio subprocess pipe to EOF, streaming lines to the callback."""
+    buf = bytearray()
+    start = 0
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        buf += chunk
+        start = _emit_lines(buf, start, progress_callback)
+    
+    if start < len(buf):
+        progress_callback(_decode_output(buf[start:]).rstrip("\r"))
+    return _decode_output(buf)
+
+
+async def _stop_aio_process(process: asyncio.subprocess.Process, grace: float) -> None:
+    """Terminate an asyncio subprocess, killing it if it outlives grace seconds."""
+    try:
+        process.terminate()
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(process.wait(), grace)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+
+
+async def _cancel_other_tasks() -> None:
+    """Cancel every other task on the running loop and wait for them to finish."""
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@dataclass
+class _ActiveProcess:
+    """Entry in ProcessManager's active process table."""
+    popen: Union[subprocess.Popen, asyncio.subprocess.Process]
+    tool_name: str
+    started_at: float
+    # Created on first inspection and reused so cpu_percent() has a baseline
+    psutil_process: Optional[psutil.Process] = None
+    # Event loop owning the process, for asyncio subprocesses
+    loop: Optional[asyncio.AbstractEventLoop] = None
+
+
 class ProcessResult:
     """Container for process execution results."""
     
@@ -46,15 +151,31 @@ class ProcessResult:
 class ProcessMonitor:
     """Monitor process resource usage during execution."""
     
+    # Samples closer than these deltas count as idle and stretch the interval
+    IDLE_CPU_DELTA = 1.0
+    IDLE_MEMORY_DELTA_MB = 1.0
+    BACKOFF_FACTOR = 1.5
+    
     def __init__(self, process: psutil.Process, log_manager: LogManager, 
-                 tool_name: str, sample_interval: float = 1.0):
+                 tool_name: str, sample_interval: float = 1.0,
+                 max_sample_interval: float = 15.0):
         self.process = process
         self.log_manager = log_manager
         self.tool_name = tool_name
         self.sample_interval = sample_interval
+        self.max_sample_interval = max(max_sample_interval, sample_interval)
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
-        self.metrics: List[Dict[str, Any]] = []
+        self._current_interval = sample_interval
+        # Previous (cpu_percent, memory_mb) sample, for idle detection
+        self._previous_sample: Optional[Tuple[float, float]] = None
+        # Summary aggregates, updated as each sample is taken
+        self._samples = 0
+        self._sampled_seconds = 0.0
+        self._cpu_min = self._memory_min = float("inf")
+        self._cpu_max = self._memory_max = float("-inf")
+        self._cpu_sum = self._memory_sum = 0.0
+        self._stop_event = threading.Event()
     
     def start_monitoring(self) -> None:
         """Start monitoring process resources."""
@@ -62,44 +183,43 @@ class ProcessMonitor:
             return
         
         self.monitoring = True
+        self._stop_event.clear()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
     
     def stop_monitoring(self) -> Dict[str, Any]:
         """Stop monitoring and return summary metrics."""
         self.monitoring = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5.0)
         
-        if not self.metrics:
+        if not self._samples:
             return {}
         
-        # Calculate summary statistics
-        cpu_values = [m['cpu_percent'] for m in self.metrics]
-        memory_values = [m['memory_mb'] for m in self.metrics]
-        
         summary = {
-            'samples': len(self.metrics),
-            'duration_seconds': len(self.metrics) * self.sample_interval,
+            'samples': self._samples,
+            'duration_seconds': self._sampled_seconds,
             'cpu_percent': {
-                'min': min(cpu_values) if cpu_values else 0,
-                'max': max(cpu_values) if cpu_values else 0,
-                'avg': sum(cpu_values) / len(cpu_values) if cpu_values else 0
+                'min': self._cpu_min,
+                'max': self._cpu_max,
+                'avg': self._cpu_sum / self._samples
             },
             'memory_mb': {
-                'min': min(memory_values) if memory_values else 0,
-                'max': max(memory_values) if memory_values else 0,
-                'avg': sum(memory_values) / len(memory_values) if memory_values else 0
+                'min': self._memory_min,
+                'max': self._memory_max,
+                'avg': self._memory_sum / self._samples
             }
         }
         
-        self.log_manager.log_performance_metric(
-            f"{self.tool_name}_resource_usage",
-            summary['cpu_percent']['avg'],
-            unit="cpu_percent",
-            memory_mb_avg=summary['memory_mb']['avg'],
-            memory_mb_max=summary['memory_mb']['max']
-        )
+        if self.log_manager.is_enabled("postcodemon.metrics"):
+            self.log_manager.log_performance_metric(
+                f"{self.tool_name}_resource_usage",
+                summary['cpu_percent']['avg'],
+                unit="cpu_percent",
+                memory_mb_avg=summary['memory_mb']['avg'],
+                memory_mb_max=summary['memory_mb']['max']
+            )
         
         return summary
     
@@ -109,33 +229,247 @@ class ProcessMonitor:
             try:
                 if self.process.is_running():
                     cpu_percent = self.process.cpu_percent()
-                    memory_info = self.process.memory_info()
-                    
-                    metric = {
-                        'timestamp': time.time(),
-                        'cpu_percent': cpu_percent,
-                        'memory_mb': memory_info.rss / 1024 / 1024,
-                        'num_threads': self.process.num_threads()
-                    }
+                    memory_mb = self.process.memory_info().rss / 1024 / 1024
                     
-                    self.metrics.append(metric)
+                    self._adjust_interval(cpu_percent, memory_mb)
+                    self._update_aggregates(cpu_percent, memory_mb, self._current_interval)
+                    self._previous_sample = (cpu_percent, memory_mb)
                 else:
                     break
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 break
             
-            time.sleep(self.sample_interval)
+            self._stop_event.wait(self._current_interval)
+    
+    def _update_aggregates(self, cpu: float, memory: float, interval: float) -> None:
+        """Fold one sample into the running summary statistics."""
+        self._samples += 1
+        self._sampled_seconds += interval
+        self._cpu_sum += cpu
+        self._memory_sum += memory
+        if cpu < self._cpu_min:
+            self._cpu_min = cpu
+        if cpu > self._cpu_max:
+            self._cpu_max = cpu
+        if memory < self._memory_min:
+            self._memory_min = memory
+        if memory > self._memory_max:
+            self._memory_max = memory
+    
+    def _adjust_interval(self, cpu: float, memory: float) -> None:
+        """Back off sampling while the process is idle, reset on activity."""
+        if self._previous_sample is None:
+            return
+        
+        previous_cpu, previous_memory = self._previous_sample
+        idle = (
+            abs(cpu - previous_cpu) < self.IDLE_CPU_DELTA and
+            abs(memory - previous_memory) < self.IDLE_MEMORY_DELTA_MB
+        )
+        if idle:
+            self._current_interval = min(
+                self._current_interval * self.BACKOFF_FACTOR, self.max_sample_interval
+            )
+        else:
+            self._current_interval = self.sample_interval
+
+
+class _ExitWatcher:
+    """Single background thread that reports exits for every watched PID.
+    
+    Uses Linux pidfds, so the exit status is left for Popen to collect
+    (a waitpid(-1) reaper would steal it). Callers block on an Event
+    instead of Popen.wait(timeout)'s sleep-and-poll loop.
+    """
+    
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[int, threading.Event]] = []
+        self._wake_read, self._wake_write = os.pipe()
+        os.set_blocking(self._wake_read, False)
+        self._selector.register(self._wake_read, selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self._thread.start()
+    
+    def watch(self, pid: int) -> Optional[threading.Event]:
+        """Return an Event set when pid exits, or None if it can't be watched."""
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            return None
+        
+        exited = threading.Event()
+        with self._lock:
+            self._pending.append((pidfd, exited))
+        os.write(self._wake_write, b"\0")
+        return exited
+    
+    def _watch_loop(self) -> None:
+        """Register new pidfds and fire events as processes exit."""
+        while True:
+            for key, _ in self._selector.select():
+                if key.fd == self._wake_read:
+                    try:
+                        os.read(self._wake_read, 4096)
+                    except BlockingIOError:
+                        pass
+                    with self._lock:
+                        pending, self._pending = self._pending, []
+                    for pidfd, exited in pending:
+                        self._selector.register(pidfd, selectors.EVENT_READ, exited)
+                else:
+                    self._selector.unregister(key.fd)
+                    os.close(key.fd)
+                    key.data.set()
+
+
+_exit_watcher: Optional[_ExitWatcher] = None
+_exit_watcher_lock = threading.Lock()
+
+
+def _get_exit_watcher() -> Optional[_ExitWatcher]:
+    """Return the shared exit watcher, or None where pidfds are unavailable."""
+    global _exit_watcher
+    if not hasattr(os, "pidfd_open"):
+        return None
+    with _exit_watcher_lock:
+        if _exit_watcher is None:
+            _exit_watcher = _ExitWatcher()
+        return _exit_watcher
 
 
 class ProcessManager:
     """Manages execution of Windows tools with advanced features."""
     
+    _EXE_SUFFIX_VARIANTS = (".exe", "")
+    
     def __init__(self, log_manager: LogManager, max_concurrent: int = 10):
         self.log_manager = log_manager
-        self.max_concurrent = max_concurrent
-        self.executor = ThreadPoolExecutor(max_workers=max_concurrent)
-        self.active_processes: Dict[str, subprocess.Popen] = {}
-        self.process_lock = threading.Lock()
+        self.max_concurrent = min(max_concurrent, MAX_CONCURRENT_EXECUTIONS)
+        
+        # Active processes are striped across shards, each guarded by its own
+        # lock, so concurrent executions don't serialize on a single mutex
+        self._shards: List[Tuple[threading.Lock, Dict[str, _ActiveProcess]]] = [
+            (threading.Lock(), {}) for _ in range(PROCESS_TABLE_STRIPES)
+        ]
+        
+        # Audit/execution records are handed to a drain thread so logging
+        # never sits on the process start path or inflates measured duration
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_thread = threading.Thread(target=self._drain_log_queue, daemon=True)
+        self._log_thread.start()
+        
+        # Search locations for find_tool_executable, keyed by the PATH value
+        self._base_search: Optional[Tuple[str, ...]] = None
+        self._path_env_snapshot: Optional[str] = None
+        
+        # LRU of successful results for execute_tool(cache=True)
+        self._result_cache: "OrderedDict[Tuple, ProcessResult]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+        # Background event loop serving execute_tool_async, started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        
+        # Per event loop semaphore bounding execute_tool_aio to max_concurrent
+        self._aio_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._aio_semaphore_lock = threading.Lock()
+    
+    def clear_cache(self) -> None:
+        """Drop all memoized execution results."""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+    
+    def _get_cached_result(self, cache_key: Tuple) -> Optional[ProcessResult]:
+        """Return a copy of a memoized result, or None on a cache miss."""
+        with self._result_cache_lock:
+            cached = self._result_cache.get(cache_key)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(cache_key)
+        
+        result = copy.copy(cached)
+        result.duration = 0.0
+        return result
+    
+    def _store_cached_result(self, cache_key: Tuple, result: ProcessResult) -> None:
+        """Memoize a successful result, evicting the least recently used one."""
+        if not result.success:
+            return
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = result
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="postcodemon-aio", daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+    
+    def _get_aio_semaphore(self) -> asyncio.Semaphore:
+        """Return the execution semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._aio_semaphore_lock:
+            semaphore = self._aio_semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrent)
+                self._aio_semaphores[loop] = semaphore
+            return semaphore
+    
+    def _log_async(self, log_func: Callable[..., None], **kwargs) -> None:
+        """Queue a LogManager call for the drain thread."""
+        self._log_queue.put((log_func, kwargs))
+    
+    def _drain_log_queue(self) -> None:
+        """Emit queued log records until the shutdown sentinel arrives."""
+        while True:
+            item = self._log_queue.get()
+            if item is None:
+                break
+            log_func, kwargs = item
+            try:
+                log_func(**kwargs)
+            except Exception:
+                pass  # Logging failures must never take down the drain thread
+    
+    def _shard(self, key: str) -> Tuple[threading.Lock, Dict[str, _ActiveProcess]]:
+        """Return the (lock, table) shard that owns a process key."""
+        return self._shards[hash(key) % PROCESS_TABLE_STRIPES]
+    
+    @property
+    def active_processes(self) -> Dict[str, subprocess.Popen]:
+        """Snapshot of all tracked processes across every shard."""
+        merged: Dict[str, subprocess.Popen] = {}
+        for lock, table in self._shards:
+            with lock:
+                for key, entry in table.items():
+                    merged[key] = entry.popen
+        return merged
+    
+    def _get_base_search_locations(self) -> Tuple[str, ...]:
+        """Common executable locations plus PATH, rebuilt only when PATH changes."""
+        path_env = os.environ.get("PATH", "")
+        if self._base_search is None or path_env != self._path_env_snapshot:
+            locations = [
+                os.path.join(os.path.expanduser("~"), "bin"),
+                "C:/Windows/System32",
+                "C:/Program Files",
+                "C:/Program Files (x86)"
+            ]
+            locations.extend(p for p in path_env.split(os.pathsep) if p)
+            self._base_search = tuple(locations)
+            self._path_env_snapshot = path_env
+        return self._base_search
     
     def find_tool_executable(self, tool_path: str, search_paths: Optional[List[str]] = None) -> str:
         """Find the executable for a tool, searching common locations."""
@@ -143,69 +477,107 @@ class ProcessManager:
         if os.path.isabs(tool_path) and os.path.isfile(tool_path):
             return tool_path
         
-        search_locations = search_paths or []
-        
-        # Add common Windows executable locations
-        search_locations.extend([
-            os.getcwd(),
-            str(Path.home() / "bin"),
-            "C:/Windows/System32",
-            "C:/Program Files",
-            "C:/Program Files (x86)"
-        ])
-        
-        # Add PATH directories
-        search_locations.extend(os.environ.get("PATH", "").split(os.pathsep))
+        # Explicit paths first, then the current directory (which may change
+        # between calls), then the cached common locations and PATH entries
+        search_locations = [p for p in search_paths or [] if p]
+        search_locations.append(os.getcwd())
+        search_locations.extend(self._get_base_search_locations())
         
-        # Try each location
+        # Try each location; .exe first since it is the common case for
+        # Windows tools, so most lookups stop after a single stat
         for search_path in search_locations:
-            if not search_path:
-                continue
-            
-            candidate_path = Path(search_path) / tool_path
-            
-            # Try with and without .exe extension
-            for path_to_try in [candidate_path, Path(str(candidate_path) + ".exe")]:
-                if path_to_try.is_file():
-                    return str(path_to_try.resolve())
+            base = os.path.join(search_path, tool_path)
+            for suffix in self._EXE_SUFFIX_VARIANTS:
+                candidate = base + suffix
+                if os.path.isfile(candidate):
+                    return os.path.abspath(candidate)
         
         raise ToolNotFoundError(tool_path, search_locations)
     
-    def execute_tool(self, tool_name: str, executable_path: str, args: List[str],
-                    timeout: Optional[int] = None, cwd: Optional[str] = None,
-                    env: Optional[Dict[str, str]] = None,
-                    monitor_resources: bool = True,
-                    progress_callback: Optional[Callable[[str], None]] = None) -> ProcessResult:
-        """Execute a Windows tool with comprehensive monitoring and error handling."""
-        
+    @staticmethod
+    def _cache_key(executable_path: str, args: List[str], cwd: Optional[str],
+                   env: Optional[Dict[str, str]]) -> Tuple:
+        """Build the result cache key for an invocation."""
+        return (executable_path, tuple(args), cwd, frozenset(env.items()) if env else None)
+    
+    def _prepare_command(self, tool_name: str, executable_path: str, args: List[str],
+                         cwd: Optional[str], timeout: Optional[int]) -> str:
+        """Resolve the executable, build the shell command and audit the start."""
         # Validate executable exists
         if not os.path.isfile(executable_path):
             executable_path = self.find_tool_executable(executable_path)
         
-        # Prepare command
         command_list = [executable_path] + args
         command_str = " ".join(f'"{arg}"' if " " in arg else arg for arg in command_list)
         
-        self.log_manager.log_audit_event(
-            "tool_execution_start",
-            details={
-                "tool_name": tool_name,
-                "command": command_str,
-                "cwd": cwd,
-                "timeout": timeout
-            }
-        )
+        if self.log_manager.is_audit_enabled():
+            self._log_async(
+                self.log_manager.log_audit_event,
+                event_type="tool_execution_start",
+                details={
+                    "tool_name": tool_name,
+                    "command": command_str,
+                    "cwd": cwd,
+                    "timeout": timeout
+                }
+            )
         
-        # Prepare environment
-        process_env = os.environ.copy()
-        if env:
-            process_env.update(env)
+        return command_str
+    
+    @staticmethod
+    def build_env(base: Dict[str, str], *overrides: Optional[Dict[str, str]]) -> ChildEnvironment:
+        """Layer overrides on base into a complete child environment."""
+        process_env = ChildEnvironment(base)
+        for override in overrides:
+            if override:
+                process_env.update(override)
+        process_env.update(_FORCED_CHILD_ENV)
+        return process_env
+    
+    @classmethod
+    def _process_env(cls, env: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Return the child environment for an env argument.
+        
+        A ChildEnvironment is used unchanged; anything else is a set of
+        overrides applied to the current os.environ.
+        """
+        if isinstance(env, ChildEnvironment):
+            return env
+        return cls.build_env(os.environ, env)
+    
+    def execute_tool(self, tool_name: str, executable_path: str, args: List[str],
+                    timeout: Optional[int] = None, cwd: Optional[str] = None,
+                    env: Optional[Dict[str, str]] = None,
+                    monitor_resources: bool = True,
+                    progress_callback: Optional[Callable[[str], None]] = None,
+                    cache: bool = False,
+                    cancel_event: Optional[threading.Event] = None,
+                    startupinfo: Optional[Any] = None,
+                    creationflags: int = 0) -> ProcessResult:
+        """Execute a Windows tool with comprehensive monitoring and error handling.
+        
+        With cache=True, a successful result is memoized by (executable, args,
+        cwd, env) and later identical calls return a copy of it without
+        spawning the tool. Only use this for side-effect-free invocations
+        such as version probes.
+        
+        If cancel_event is set while the tool runs, the process is terminated
+        and ToolExecutionError is raised with return code -2.
+        
+        startupinfo and creationflags are passed to Popen on Windows only.
+        """
+        cache_key = None
+        if cache:
+            cache_key = self._cache_key(executable_path, args, cwd, env)
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                return cached
+        
+        command_str = self._prepare_command(tool_name, executable_path, args, cwd, timeout)
         
         start_time = time.time()
         process = None
         monitor = None
-        stdout_thread = None
-        stderr_thread = None
         interrupted = False
         
         try:
@@ -215,47 +587,64 @@ class ProcessManager:
             ):
                 # Start the process with real-time output
                 # Use shell=True for better real-time output on Windows
-                command_str = " ".join(f'"{arg}"' if " " in arg else arg for arg in command_list)
-                
-                # Add environment variables to force line buffering
-                process_env_copy = process_env.copy()
-                process_env_copy['PYTHONUNBUFFERED'] = '1'
-                process_env_copy['PYTHONIOENCODING'] = 'utf-8'
-                
                 # Don't redirect output - let the tool write directly to console
-                # This is the key to getting real-time output
+                # This is the key to getting real-time output. Output is only
+                # piped when a progress_callback wants to see it line by line.
+                capture_output = progress_callback is not None
+                win_spawn_kwargs = {}
+                if sys.platform == "win32":
+                    win_spawn_kwargs = {
+                        "startupinfo": startupinfo,
+                        "creationflags": creationflags
+                    }
+                # Arguments chosen so subprocess takes its vfork/posix_spawn
+                # path, not fork+exec: no preexec_fn, user/group switch or new
+                # session, and cwd as a plain str. close_fds stays at its
+                # default so our pipes and pidfds never leak into tools.
                 process = subprocess.Popen(
                     command_str,
                     shell=True,
-                    cwd=cwd,
-                    env=process_env_copy,
-                    text=True,
-                    bufsize=0,
-                    universal_newlines=True
-                    # No stdout/stderr redirection - let output go directly to console
+                    cwd=os.fspath(cwd) if cwd is not None else None,
+                    env=self._process_env(env),
+                    stdout=subprocess.PIPE if capture_output else None,
+                    stderr=subprocess.PIPE if capture_output else None,
+                    **win_spawn_kwargs
                 )
                 
                 # Track active process
                 process_id = f"{tool_name}_{process.pid}"
-                with self.process_lock:
-                    self.active_processes[process_id] = process
+                shard_lock, shard = self._shard(process_id)
+                with shard_lock:
+                    shard[process_id] = _ActiveProcess(process, tool_name, time.time())
+                
+                def start_monitor() -> None:
+                    nonlocal monitor
+                    try:
+                        psutil_process = psutil.Process(process.pid)
+                        monitor = ProcessMonitor(
+                            psutil_process, self.log_manager, tool_name
+                        )
+                        monitor.start_monitoring()
+                    except psutil.NoSuchProcess:
+                        pass  # Process may have finished already
                 
                 try:
-                    # Start resource monitoring
-                    if monitor_resources:
-                        try:
-                            psutil_process = psutil.Process(process.pid)
-                            monitor = ProcessMonitor(
-                                psutil_process, self.log_manager, tool_name
-                            )
-                            monitor.start_monitoring()
-                        except psutil.NoSuchProcess:
-                            pass  # Process may have finished already
+                    # Resource monitoring only starts once the tool has outlived
+                    # MONITOR_START_DELAY, so short-lived tools skip it entirely
+                    on_still_running = start_monitor if monitor_resources else None
                     
-                    # No output reading needed since output goes directly to console
-                    # Just wait for process completion
+                    stdout_str = ""  # No captured output since it goes directly to console
+                    stderr_str = ""  # No captured stderr
                     try:
-                        return_code = process.wait(timeout=timeout)
+                        if capture_output:
+                            return_code, stdout_str, stderr_str = self._pump_output(
+                                process, timeout, progress_callback, on_still_running,
+                                cancel_event
+                            )
+                        else:
+                            return_code = self._wait_for_exit(
+                                process, timeout, on_still_running, cancel_event
+                            )
                     except subprocess.TimeoutExpired:
                         # Terminate process gracefully, then force kill if needed
                         process.terminate()
@@ -265,10 +654,18 @@ class ProcessManager:
                             process.kill()
                             process.wait()
                         raise TimeoutError(timeout or 0)
+                    except _ExecutionCancelled:
+                        process.terminate()
+                        try:
+                            process.wait(timeout=5)
+                        except subprocess.TimeoutExpired:
+                            process.kill()
+                            process.wait()
+                        raise ToolExecutionError(
+                            f"Tool '{tool_name}' execution cancelled", -2, "cancelled"
+                        )
                     
                     duration = time.time() - start_time
-                    stdout_str = ""  # No captured output since it goes directly to console
-                    stderr_str = ""  # No captured stderr
                     
                     # Stop monitoring and get metrics
                     resource_metrics = {}
@@ -285,23 +682,28 @@ class ProcessManager:
                         tool_name=tool_name
                     )
                     
-                    # Log execution details
-                    self.log_manager.log_tool_execution(
-                        tool_name=tool_name,
-                        command=command_str,
-                        return_code=return_code,
-                        stdout=stdout_str,
-                        stderr=stderr_str,
-                        duration=duration,
-                        resource_metrics=resource_metrics
-                    )
+                    # Log execution details (failures are logged at ERROR)
+                    if not result.success or self.log_manager.is_enabled("postcodemon.execution"):
+                        self._log_async(
+                            self.log_manager.log_tool_execution,
+                            tool_name=tool_name,
+                            command=command_str,
+                            return_code=return_code,
+                            stdout=stdout_str,
+                            stderr=stderr_str,
+                            duration=duration,
+                            resource_metrics=resource_metrics
+                        )
+                    
+                    if cache_key is not None:
+                        self._store_cached_result(cache_key, result)
                     
                     return result
                 
                 finally:
                     # Clean up active process tracking
-                    with self.process_lock:
-                        self.active_processes.pop(process_id, None)
+                    with shard_lock:
+                        shard.pop(process_id, None)
         
         except KeyboardInterrupt:
             interrupted = True
@@ -320,18 +722,16 @@ class ProcessManager:
                     process.kill()
                     process.wait()
             
-            # Clear output buffers to prevent showing interrupted output
-            stdout_lines.clear()
-            stderr_lines.clear()
-            
-            self.log_manager.log_audit_event(
-                "tool_execution_interrupted",
-                details={
-                    "tool_name": tool_name,
-                    "command": command_str,
-                    "duration": duration
-                }
-            )
+            if self.log_manager.is_audit_enabled():
+                self._log_async(
+                    self.log_manager.log_audit_event,
+                    event_type="tool_execution_interrupted",
+                    details={
+                        "tool_name": tool_name,
+                        "command": command_str,
+                        "duration": duration
+                    }
+                )
             
             # Return a result indicating interruption
             return ProcessResult(
@@ -350,17 +750,19 @@ class ProcessManager:
             if monitor:
                 monitor.stop_monitoring()
             
-            self.log_manager.log_audit_event(
-                "tool_execution_error",
-                details={
-                    "tool_name": tool_name,
-                    "command": command_str,
-                    "error": str(e),
-                    "duration": duration
-                }
-            )
+            if self.log_manager.is_audit_enabled():
+                self._log_async(
+                    self.log_manager.log_audit_event,
+                    event_type="tool_execution_error",
+                    details={
+                        "tool_name": tool_name,
+                        "command": command_str,
+                        "error": str(e),
+                        "duration": duration
+                    }
+                )
             
-            if isinstance(e, (TimeoutError, ToolNotFoundError)):
+            if isinstance(e, (TimeoutError, ToolNotFoundError, ToolExecutionError)):
                 raise
             else:
                 raise ToolExecutionError(
@@ -369,92 +771,531 @@ class ProcessManager:
                     str(e)
                 )
     
-    def execute_tool_async(self, tool_name: str, executable_path: str, args: List[str],
-                          **kwargs) -> Future[ProcessResult]:
-        """Execute a tool asynchronously."""
-        return self.executor.submit(
-            self.execute_tool, tool_name, executable_path, args, **kwargs
-        )
+    def _wait_for_exit(self, process: subprocess.Popen, timeout: Optional[int],
+                       on_still_running: Optional[Callable[[], None]] = None,
+                       cancel_event: Optional[threading.Event] = None) -> int:
+        """Wait for process exit via the shared exit watcher when available.
+        
+        on_still_running is called once if the process outlives
+        MONITOR_START_DELAY. Raises subprocess.TimeoutExpired on timeout and
+        _ExecutionCancelled once cancel_event is set.
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        watcher = _get_exit_watcher()
+        exited = watcher.watch(process.pid) if watcher else None
+        
+        def wait_once(remaining: Optional[float]) -> bool:
+            if exited is not None:
+                return exited.wait(remaining)
+            try:
+                process.wait(timeout=remaining)
+                return True
+            except subprocess.TimeoutExpired:
+                return False
+        
+        def wait_until(until: Optional[float]) -> bool:
+            """Block until exit or until passes; True if the process exited."""
+            while True:
+                remaining = None if until is None else max(until - time.monotonic(), 0)
+                if cancel_event is None:
+                    return wait_once(remaining)
+                if cancel_event.is_set():
+                    raise _ExecutionCancelled()
+                if remaining is None or remaining > CANCEL_POLL_INTERVAL:
+                    if wait_once(CANCEL_POLL_INTERVAL):
+                        return True
+                else:
+                    return wait_once(remaining)
+        
+        if on_still_running is not None:
+            defer_until = time.monotonic() + MONITOR_START_DELAY
+            if deadline is not None:
+                defer_until = min(defer_until, deadline)
+            if not wait_until(defer_until):
+                on_still_running()
+        
+        if not wait_until(deadline):
+            raise subprocess.TimeoutExpired(process.args, timeout)
+        return process.wait()
     
-    def kill_process(self, tool_name: str, process_id: Optional[int] = None) -> bool:
-        """Kill a running process by tool name or PID."""
-        with self.process_lock:
-            processes_to_kill = []
-            
-            if process_id:
-                # Kill specific process ID
-                for key, process in self.active_processes.items():
-                    if process.pid == process_id:
-                        processes_to_kill.append((key, process))
+    def _pump_output(self, process: subprocess.Popen, timeout: Optional[int],
+                     progress_callback: Callable[[str], None],
+                     on_still_running: Optional[Callable[[], None]] = None,
+                     cancel_event: Optional[threading.Event] = None) -> Tuple[int, str, str]:
+        """Drain stdout/stderr with one selector loop and wait for the process.
+        
+        Both pipes are polled from the calling thread, so no reader threads are
+        spawned per execution. Pipes are read as raw bytes and decoded once at
+        the end; only the lines handed to progress_callback are decoded early.
+        on_still_running is called once if the process outlives
+        MONITOR_START_DELAY. Raises subprocess.TimeoutExpired on timeout and
+        _ExecutionCancelled once cancel_event is set.
+        """
+        if sys.platform == "win32":
+            # Windows pipes cannot be registered with a selector
+            if on_still_running is not None:
+                on_still_running()
+            if cancel_event is None:
+                stdout, stderr = process.communicate(timeout=timeout)
             else:
-                # Kill all processes for tool name
-                for key, process in self.active_processes.items():
-                    if key.startswith(f"{tool_name}_"):
-                        processes_to_kill.append((key, process))
+                deadline = time.monotonic() + timeout if timeout else None
+                while True:
+                    if cancel_event.is_set():
+                        raise _ExecutionCancelled()
+                    wait = CANCEL_POLL_INTERVAL
+                    if deadline is not None:
+                        wait = min(wait, max(deadline - time.monotonic(), 0))
+                    try:
+                        # communicate() may be retried after TimeoutExpired
+                        stdout, stderr = process.communicate(timeout=wait)
+                        break
+                    except subprocess.TimeoutExpired:
+                        if deadline is not None and time.monotonic() >= deadline:
+                            raise
+            stdout_str = _decode_output(stdout)
+            stderr_str = _decode_output(stderr)
+            for line in stdout_str.splitlines() + stderr_str.splitlines():
+                progress_callback(line)
+            return process.returncode, stdout_str, stderr_str
+        
+        deadline = time.monotonic() + timeout if timeout else None
+        defer_until = None
+        if on_still_running is not None:
+            defer_until = time.monotonic() + MONITOR_START_DELAY
+        stdout_fd = process.stdout.fileno()
+        stderr_fd = process.stderr.fileno()
+        buffers: Dict[int, bytearray] = {stdout_fd: bytearray(), stderr_fd: bytearray()}
+        emitted: Dict[int, int] = {stdout_fd: 0, stderr_fd: 0}
+        
+        selector = selectors.DefaultSelector()
+        try:
+            for fd in buffers:
+                os.set_blocking(fd, False)
+                selector.register(fd, selectors.EVENT_READ)
             
-            killed_any = False
-            for key, process in processes_to_kill:
+            while selector.get_map():
+                now = time.monotonic()
+                wait = None
+                if deadline is not None:
+                    wait = deadline - now
+                    if wait <= 0:
+                        raise subprocess.TimeoutExpired(process.args, timeout)
+                if cancel_event is not None:
+                    if cancel_event.is_set():
+                        raise _ExecutionCancelled()
+                    wait = CANCEL_POLL_INTERVAL if wait is None else min(wait, CANCEL_POLL_INTERVAL)
+                
+                if defer_until is not None:
+                    if now >= defer_until:
+                        defer_until = None
+                        if process.poll() is None:
+                            on_still_running()
+                    else:
+                        wait = defer_until - now if wait is None else min(wait, defer_until - now)
+                
+                for key, _ in selector.select(timeout=wait):
+                    try:
+                        chunk = os.read(key.fd, 65536)
+                    except BlockingIOError:
+                        continue
+                    
+                    buf = buffers[key.fd]
+                    start = emitted[key.fd]
+                    if not chunk:
+                        # EOF - flush any unterminated last line
+                        selector.unregister(key.fd)
+                        if start < len(buf):
+                            progress_callback(_decode_output(buf[start:]).rstrip("\r"))
+                        continue
+                    
+                    buf += chunk
+                    emitted[key.fd] = _emit_lines(buf, start, progress_callback)
+        finally:
+            selector.close()
+            process.stdout.close()
+            process.stderr.close()
+        
+        remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+        return_code = process.wait(timeout=remaining)
+        return (
+            return_code,
+            _decode_output(buffers[stdout_fd]),
+            _decode_output(buffers[stderr_fd])
+        )
+    
+    async def execute_tool_aio(self, tool_name: str, executable_path: str, args: List[str],
+                               timeout: Optional[int] = None, cwd: Optional[str] = None,
+                               env: Optional[Dict[str, str]] = None,
+                               monitor_resources: bool = True,
+                               progress_callback: Optional[Callable[[str], None]] = None,
+                               cache: bool = False,
+                               cancel_event: Optional[threading.Event] = None,
+                               startupinfo: Optional[Any] = None,
+                               creationflags: int = 0) -> ProcessResult:
+        """Execute a tool as an asyncio subprocess on the running event loop.
+        
+        Same contract as execute_tool, but waiting and output streaming run on
+        the event loop, so concurrent executions need no worker or reader
+        threads. The command still goes through the shell, as in execute_tool.
+        At most max_concurrent executions run at once per event loop; the
+        rest wait for a slot.
+        """
+        cache_key = None
+        if cache:
+            cache_key = self._cache_key(executable_path, args, cwd, env)
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                return cached
+        
+        async with self._get_aio_semaphore():
+            return await self._execute_tool_aio(
+                tool_name, executable_path, args, timeout, cwd, env,
+                monitor_resources, progress_callback, cache_key,
+                cancel_event, startupinfo, creationflags
+            )
+    
+    async def _execute_tool_aio(self, tool_name: str, executable_path: str, args: List[str],
+                                timeout: Optional[int], cwd: Optional[str],
+                                env: Optional[Dict[str, str]], monitor_resources: bool,
+                                progress_callback: Optional[Callable[[str], None]],
+                                cache_key: Optional[Tuple],
+                                cancel_event: Optional[threading.Event],
+                                startupinfo: Optional[Any],
+                                creationflags: int) -> ProcessResult:
+        """Body of execute_tool_aio, run while holding an execution slot."""
+        command_str = self._prepare_command(tool_name, executable_path, args, cwd, timeout)
+        
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+        process = None
+        monitor = None
+        
+        try:
+            with self.log_manager.create_performance_logger(
+                f"execute_{tool_name}",
+                command=command_str
+            ):
+                capture_output = progress_callback is not None
+                win_spawn_kwargs = {}
+                if sys.platform == "win32":
+                    win_spawn_kwargs = {
+                        "startupinfo": startupinfo,
+                        "creationflags": creationflags
+                    }
+                process = await asyncio.create_subprocess_shell(
+                    command_str,
+                    cwd=cwd,
+                    env=self._process_env(env),
+                    stdout=asyncio.subprocess.PIPE if capture_output else None,
+                    stderr=asyncio.subprocess.PIPE if capture_output else None,
+                    **win_spawn_kwargs
+                )
+                
+                # Track active process
+                process_id = f"{tool_name}_{process.pid}"
+                shard_lock, shard = self._shard(process_id)
+                with shard_lock:
+                    shard[process_id] = _ActiveProcess(process, tool_name, time.time(), loop=loop)
+                
+                def start_monitor() -> None:
+                    nonlocal monitor
+                    if process.returncode is not None:
+                        return
+                    try:
+                        monitor = ProcessMonitor(
+                            psutil.Process(process.pid), self.log_manager, tool_name
+                        )
+                        monitor.start_monitoring()
+                    except psutil.NoSuchProcess:
+                        pass  # Process may have finished already
+                
+                async def communicate() -> Tuple[int, str, str]:
+                    stdout_str = stderr_str = ""
+                    if capture_output:
+                        stdout_str, stderr_str = await asyncio.gather(
+                            _read_stream_aio(process.stdout, progress_callback),
+                            _read_stream_aio(process.stderr, progress_callback)
+                        )
+                    return await process.wait(), stdout_str, stderr_str
+                
+                async def communicate_or_cancel() -> Tuple[int, str, str]:
+                    if cancel_event is None:
+                        return await communicate()
+                    # cancel_event is a threading.Event, so poll it like execute_tool
+                    task = asyncio.ensure_future(communicate())
+                    try:
+                        while True:
+                            done, _ = await asyncio.wait({task}, timeout=CANCEL_POLL_INTERVAL)
+                            if done:
+                                return task.result()
+                            if cancel_event.is_set():
+                                raise _ExecutionCancelled()
+                    finally:
+                        if not task.done():
+                            task.cancel()
+                
+                # Same deferred monitor start as execute_tool
+                monitor_handle = None
+                if monitor_resources:
+                    monitor_handle = loop.call_later(MONITOR_START_DELAY, start_monitor)
+                
                 try:
-                    process.terminate()
                     try:
-                        process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                        process.wait()
+                        return_code, stdout_str, stderr_str = await asyncio.wait_for(
+                            communicate_or_cancel(), timeout or None
+                        )
+                    except asyncio.TimeoutError:
+                        await _stop_aio_process(process, 5)
+                        raise TimeoutError(timeout or 0)
+                    except _ExecutionCancelled:
+                        await _stop_aio_process(process, 5)
+                        raise ToolExecutionError(
+                            f"Tool '{tool_name}' execution cancelled", -2, "cancelled"
+                        )
+                    except asyncio.CancelledError:
+                        if monitor_handle:
+                            monitor_handle.cancel()
+                        await _stop_aio_process(process, 2)
+                        if monitor:
+                            await loop.run_in_executor(None, monitor.stop_monitoring)
+                        raise
+                    finally:
+                        if monitor_handle:
+                            monitor_handle.cancel()
                     
-                    self.active_processes.pop(key, None)
-                    killed_any = True
+                    duration = time.time() - start_time
                     
+                    resource_metrics = {}
+                    if monitor:
+                        # stop_monitoring joins the monitor thread; keep it off the loop
+                        resource_metrics = await loop.run_in_executor(None, monitor.stop_monitoring)
+                    
+                    result = ProcessResult(
+                        return_code=return_code,
+                        stdout=stdout_str,
+                        stderr=stderr_str,
+                        duration=duration,
+                        command=command_str,
+                        tool_name=tool_name
+                    )
+                    
+                    # Log execution details (failures are logged at ERROR)
+                    if not result.success or self.log_manager.is_enabled("postcodemon.execution"):
+                        self._log_async(
+                            self.log_manager.log_tool_execution,
+                            tool_name=tool_name,
+                            command=command_str,
+                            return_code=return_code,
+                            stdout=stdout_str,
+                            stderr=stderr_str,
+                            duration=duration,
+                            resource_metrics=resource_metrics
+                        )
+                    
+                    if cache_key is not None:
+                        self._store_cached_result(cache_key, result)
+                    
+                    return result
+                
+                finally:
+                    # Clean up active process tracking
+                    with shard_lock:
+                        shard.pop(process_id, None)
+        
+        except KeyboardInterrupt:
+            duration = time.time() - start_time
+            
+            # Stop monitoring on interruption
+            if monitor:
+                await loop.run_in_executor(None, monitor.stop_monitoring)
+            
+            # Terminate the process immediately
+            if process is not None:
+                await _stop_aio_process(process, 2)
+            
+            if self.log_manager.is_audit_enabled():
+                self._log_async(
+                    self.log_manager.log_audit_event,
+                    event_type="tool_execution_interrupted",
+                    details={
+                        "tool_name": tool_name,
+                        "command": command_str,
+                        "duration": duration
+                    }
+                )
+            
+            # Return a result indicating interruption
+            return ProcessResult(
+                return_code=-1,
+                stdout="",
+                stderr="Process interrupted by user",
+                duration=duration,
+                command=command_str,
+                tool_name=tool_name
+            )
+        
+        except Exception as e:
+            duration = time.time() - start_time
+            
+            # Stop monitoring on error
+            if monitor:
+                await loop.run_in_executor(None, monitor.stop_monitoring)
+            
+            if self.log_manager.is_audit_enabled():
+                self._log_async(
+                    self.log_manager.log_audit_event,
+                    event_type="tool_execution_error",
+                    details={
+                        "tool_name": tool_name,
+                        "command": command_str,
+                        "error": str(e),
+                        "duration": duration
+                    }
+                )
+            
+            if isinstance(e, (TimeoutError, ToolNotFoundError, ToolExecutionError)):
+                raise
+            else:
+                raise ToolExecutionError(
+                    f"Failed to execute tool '{tool_name}': {e}",
+                    -1,
+                    str(e)
+                )
+    
+    def execute_tool_async(self, tool_name: str, executable_path: str, args: List[str],
+                          **kwargs) -> Future[ProcessResult]:
+        """Execute a tool asynchronously.
+        
+        Runs execute_tool_aio on the manager's shared background event loop,
+        so concurrent executions share a single thread and at most
+        max_concurrent of them run at once. Accepts the same keyword
+        arguments as execute_tool.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.execute_tool_aio(tool_name, executable_path, args, **kwargs),
+            self._get_event_loop()
+        )
+    
+    def _stop_process(self, entry: _ActiveProcess, grace: float) -> None:
+        """Terminate a tracked process, killing it if it outlives grace seconds."""
+        if entry.loop is not None:
+            try:
+                on_loop_thread = asyncio.get_running_loop() is entry.loop
+            except RuntimeError:
+                on_loop_thread = False
+            if on_loop_thread:
+                # Blocking here would wait on the loop we are running on
+                entry.loop.create_task(_stop_aio_process(entry.popen, grace))
+            else:
+                asyncio.run_coroutine_threadsafe(
+                    _stop_aio_process(entry.popen, grace), entry.loop
+                ).result()
+            return
+        
+        process = entry.popen
+        process.terminate()
+        try:
+            process.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+    
+    def kill_process(self, tool_name: str, process_id: Optional[int] = None) -> bool:
+        """Kill a running process by tool name or PID."""
+        processes_to_kill = []
+        for lock, table in self._shards:
+            with lock:
+                for key, entry in table.items():
+                    if process_id:
+                        # Kill specific process ID
+                        if entry.popen.pid == process_id:
+                            processes_to_kill.append((key, entry))
+                    elif entry.tool_name == tool_name:
+                        # Kill all processes for tool name
+                        processes_to_kill.append((key, entry))
+        
+        killed_any = False
+        for key, entry in processes_to_kill:
+            pid = entry.popen.pid
+            try:
+                self._stop_process(entry, 5)
+                
+                lock, table = self._shard(key)
+                with lock:
+                    table.pop(key, None)
+                killed_any = True
+                
+                if self.log_manager.is_audit_enabled():
                     self.log_manager.log_audit_event(
                         "process_killed",
-                        details={"tool_name": tool_name, "pid": process.pid}
+                        details={"tool_name": tool_name, "pid": pid}
                     )
-                except Exception as e:
-                    self.log_manager.get_logger("postcodemon.process").warning(
-                        f"Failed to kill process {process.pid}: {e}"
-                    )
-            
-            return killed_any
+            except Exception as e:
+                self.log_manager.get_logger("postcodemon.process").warning(
+                    f"Failed to kill process {pid}: {e}"
+                )
+        
+        return killed_any
     
     def get_active_processes(self) -> Dict[str, Dict[str, Any]]:
         """Get information about currently active processes."""
-        with self.process_lock:
-            active = {}
-            for key, process in self.active_processes.items():
-                try:
-                    psutil_process = psutil.Process(process.pid)
-                    active[key] = {
-                        'pid': process.pid,
-                        'tool_name': key.split('_')[0],
-                        'status': psutil_process.status(),
-                        'cpu_percent': psutil_process.cpu_percent(),
-                        'memory_mb': psutil_process.memory_info().rss / 1024 / 1024,
-                        'create_time': psutil_process.create_time()
-                    }
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    # Process no longer exists, clean it up
-                    pass
-            
-            # Clean up stale processes
-            stale_keys = [k for k in self.active_processes.keys() if k not in active]
-            for key in stale_keys:
-                self.active_processes.pop(key, None)
-            
-            return active
+        active = {}
+        for lock, table in self._shards:
+            with lock:
+                for key, entry in table.items():
+                    try:
+                        if entry.psutil_process is None:
+                            entry.psutil_process = psutil.Process(entry.popen.pid)
+                        psutil_process = entry.psutil_process
+                        active[key] = {
+                            'pid': entry.popen.pid,
+                            'tool_name': entry.tool_name,
+                            'status': psutil_process.status(),
+                            'cpu_percent': psutil_process.cpu_percent(),
+                            'memory_mb': psutil_process.memory_info().rss / 1024 / 1024,
+                            'create_time': psutil_process.create_time()
+                        }
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        # Process no longer exists, clean it up
+                        pass
+                
+                # Clean up stale processes
+                stale_keys = [k for k in table.keys() if k not in active]
+                for key in stale_keys:
+                    table.pop(key, None)
+        
+        return active
     
     def shutdown(self) -> None:
         """Shutdown the process manager and clean up resources."""
         # Kill all active processes
-        with self.process_lock:
-            for key, process in list(self.active_processes.items()):
+        for lock, table in self._shards:
+            with lock:
+                entries = list(table.values())
+            for entry in entries:
                 try:
-                    process.terminate()
-                    process.wait(timeout=2)
+                    self._stop_process(entry, 2)
                 except (subprocess.TimeoutExpired, ProcessLookupError):
+                    pass
+        
+        # Stop the background event loop once its processes are gone. Pending
+        # executions are cancelled and awaited first, so every future returned
+        # by execute_tool_async resolves and no task outlives the loop.
+        with self._loop_lock:
+            if self._loop is not None:
+                if threading.current_thread() is not self._loop_thread:
                     try:
-                        process.kill()
-                    except ProcessLookupError:
-                        pass
+                        asyncio.run_coroutine_threadsafe(
+                            _cancel_other_tasks(), self._loop
+                        ).result(timeout=10.0)
+                    except Exception:
+                        pass  # Stop the loop regardless
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop_thread.join(timeout=5.0)
+                if not self._loop_thread.is_alive():
+                    self._loop.close()
+                self._loop = None
         
-        # Shutdown thread pool (remove timeout parameter for compatibility)
-        self.executor.shutdown(wait=True)
\ No newline at end of file
+        # Flush queued log records before the log manager goes away
+        self._log_queue.put(None)
+        self._log_thread.join(timeout=5.0)
@@ -1,12 +1,21 @@
 """Main wrapper class that orchestrates all PostCodeMon functionality."""
 
+import _thread
+import functools
+import logging
 import os
+import queue
 import signal
+import subprocess
 import sys
+import threading
 import time
+import weakref
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, List, Optional, Tuple, Union, Callable
 import atexit
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 
 from .config import ConfigManager, ToolConfig, WrapperConfig
 from .logger import LogManager
@@ -17,6 +26,41 @@ from .errors import (
 )
 
 
+class _LazyJoin:
+    """Joins parts on first str() so unused command previews cost nothing."""
+    
+    __slots__ = ('parts', 'sep', '_text')
+    
+    def __init__(self, parts: List[str], sep: str = " "):
+        self.parts = parts
+        self.sep = sep
+        self._text: Optional[str] = None
+    
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self.sep.join(self.parts)
+        return self._text
+
+
+def _shutdown_if_alive(wrapper_ref: "weakref.ref[ToolWrapper]") -> None:
+    """atexit hook: shut down a wrapper if it has not been garbage collected."""
+    wrapper = wrapper_ref()
+    if wrapper is not None:
+        wrapper.shutdown()
+
+
+class _WrapperLoggerAdapter(logging.LoggerAdapter):
+    """LoggerAdapter that merges its static fields into per-call extra.
+    
+    The stdlib adapter replaces a call's extra with its own before 3.13.
+    """
+    
+    def process(self, msg, kwargs):
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
+
 class ToolWrapper:
     """Main wrapper class for Windows CLI tools."""
     
@@ -38,12 +82,60 @@ class ToolWrapper:
         )
         
         self.tool_name = tool_name
-        self.logger = self.log_manager.get_logger("postcodemon.wrapper")
+        self.logger = _WrapperLoggerAdapter(
+            self.log_manager.get_logger("postcodemon.wrapper"), {"component": "wrapper"}
+        )
+        
+        # Baseline environment, and per-tool environments layered on top of it
+        self._env_snapshot: Dict[str, str] = dict(os.environ)
+        self._tool_env_cache: Dict[str, Dict[str, str]] = {}
+        
+        # Local references to the configured tools for validate_tool_config
+        self._tool_configs: Dict[str, ToolConfig] = dict(self.config.tools)
+        self._tool_names_list: List[str] = list(self._tool_configs)
+        
+        # Per-tool default_args as tuples, filled on first validation
+        self._default_args_cache: Dict[str, Tuple[str, ...]] = {}
+        
+        # Per-tool Windows spawn options (shared STARTUPINFO), built once
+        self._win_spawn_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # get_tool_info results, reused until the config is reloaded
+        self._tool_info_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Version flag that last produced output for each tool
+        self._version_flags: Dict[str, str] = {}
+        
+        # Retry/failure banners are written by one printer thread, so batch
+        # workers never contend on stdout or interleave mid-line
+        self._console_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._console_thread = threading.Thread(target=self._drain_console_queue, daemon=True)
+        self._console_thread.start()
         
-        # Register cleanup handlers
-        atexit.register(self.shutdown)
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # Worker pool shared by execute_batch calls at the default concurrency
+        self._batch_pool = self._create_batch_pool()
+        
+        # Register cleanup handlers. Signal handlers only write a byte to a
+        # self-pipe; the reaper thread does the actual shutdown work, so no
+        # locks are taken from inside the interrupted thread.
+        self._last_signal: Optional[int] = None
+        self._shutdown_event = threading.Event()
+        self._wakeup_r, self._wakeup_w = os.pipe()
+        self._reaper = threading.Thread(
+            target=self._reaper_loop, name="postcodemon-reaper", daemon=True
+        )
+        self._reaper.start()
+        
+        # atexit only holds a weak reference, so shut-down wrappers can be freed
+        self._shutdown_lock = threading.Lock()
+        self._shutdown_done = False
+        self._shutdown_finished = False
+        self._atexit_callback = functools.partial(_shutdown_if_alive, weakref.ref(self))
+        atexit.register(self._atexit_callback)
+        self._previous_handlers = {
+            signum: signal.signal(signum, self._signal_handler)
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
         
         self.logger.info("PostCodeMon wrapper initialized", extra={
             'tool_name': tool_name,
@@ -52,7 +144,48 @@ class ToolWrapper:
         })
     
     def _signal_handler(self, signum: int, frame) -> None:
-        """Handle system signals gracefully."""
+        """Handle system signals by waking the reaper thread.
+        
+        Once shutdown has finished (including when the reaper re-raises the
+        signal here after tearing down), exit from the main thread instead.
+        Signals arriving while a shutdown is under way are ignored.
+        """
+        if self._shutdown_finished:
+            signum = self._last_signal or signum
+            self._restore_signal_handlers()
+            sys.exit(130 if signum == signal.SIGINT else 0)
+        if self._shutdown_done:
+            return
+        if self._last_signal is None:
+            self._last_signal = signum
+            os.write(self._wakeup_w, b"\0")
+    
+    def _restore_signal_handlers(self) -> bool:
+        """Reinstall the handlers replaced in __init__ and close the self-pipe.
+        
+        Only possible on the main thread; returns False elsewhere, leaving
+        both in place so a late signal never writes to a closed fd.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        for signum, previous in self._previous_handlers.items():
+            if signal.getsignal(signum) == self._signal_handler:
+                signal.signal(signum, previous if previous is not None else signal.SIG_DFL)
+        if self._wakeup_w is not None:
+            os.close(self._wakeup_w)
+            os.close(self._wakeup_r)
+            self._wakeup_w = None
+        return True
+    
+    def _reaper_loop(self) -> None:
+        """Wait for a signal, then shut down and exit from this thread."""
+        os.read(self._wakeup_r, 1)
+        signum = self._last_signal
+        if signum is None:
+            return  # Woken by a normal shutdown()
+        
+        # Stop callers from starting further attempts while we tear down
+        self._shutdown_event.set()
         self.logger.info(f"Received signal {signum}, shutting down gracefully")
         
         # Kill all active processes first
@@ -68,19 +201,21 @@ class ToolWrapper:
         # Then shutdown normally
         self.shutdown()
         
-        # Exit with appropriate code
-        if signum == signal.SIGINT:
-            sys.exit(130)  # Standard exit code for Ctrl+C
+        # Exit through the main thread, so its finally blocks and the atexit
+        # handlers still run: this re-enters _signal_handler there, which
+        # calls sys.exit with the appropriate code
+        if sys.version_info >= (3, 10):
+            _thread.interrupt_main(signum)
         else:
-            sys.exit(0)
+            _thread.interrupt_main()
     
     def validate_tool_config(self, tool_name: str) -> ToolConfig:
         """Validate that a tool is properly configured."""
-        tool_config = self.config_manager.get_tool_config(tool_name)
-        if not tool_config:
+        tool_config = self._tool_configs.get(tool_name)
+        if tool_config is None:
             raise ConfigurationError(
                 f"Tool '{tool_name}' is not configured. "
-                f"Available tools: {list(self.config.tools.keys())}"
+                f"Available tools: {self._tool_names_list}"
             )
         
         if not tool_config.executable_path:
@@ -88,30 +223,129 @@ class ToolWrapper:
                 f"Tool '{tool_name}' has no executable_path configured"
             )
         
+        if tool_name not in self._default_args_cache:
+            self._default_args_cache[tool_name] = tuple(tool_config.default_args)
+            if sys.platform == "win32":
+                self._win_spawn_cache[tool_name] = self._create_win_spawn_kwargs()
+        
         return tool_config
     
-    def validate_arguments(self, tool_name: str, args: List[str]) -> List[str]:
-        """Validate and transform arguments according to tool configuration."""
-        tool_config = self.validate_tool_config(tool_name)
+    def _console(self, *lines: str) -> None:
+        """Queue lines for the console printer thread."""
+        self._console_queue.put("".join(f"{line}\n" for line in lines))
+    
+    def _drain_console_queue(self) -> None:
+        """Write queued console messages until the shutdown sentinel arrives."""
+        while True:
+            message = self._console_queue.get()
+            if message is None:
+                break
+            
+            # Coalesce a burst into a single write
+            batch = [message]
+            while len(batch) < 16:
+                try:
+                    message = self._console_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if message is None:
+                    self._write_console(batch)
+                    return
+                batch.append(message)
+            self._write_console(batch)
+    
+    @staticmethod
+    def _write_console(messages: List[str]) -> None:
+        """Write a batch of console messages with one call."""
+        try:
+            sys.stdout.writelines(messages)
+            sys.stdout.flush()
+        except Exception:
+            pass  # Console failures must never take down the printer thread
+    
+    def _wait_before_retry(self, wait_time: float,
+                           cancel_event: Optional[threading.Event] = None) -> bool:
+        """Sleep for a retry backoff; True if shutdown or cancel cut it short."""
+        if cancel_event is None:
+            return self._shutdown_event.wait(wait_time)
+        
+        deadline = time.monotonic() + wait_time
+        while not (cancel_event.is_set() or self._shutdown_event.is_set()):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            cancel_event.wait(min(remaining, 0.1))
+        return True
+    
+    @staticmethod
+    def _create_win_spawn_kwargs() -> Dict[str, Any]:
+        """Build the Windows STARTUPINFO/creationflags shared by a tool's spawns.
+        
+        Only hides the shell window, as shell=True already would; flags such as
+        CREATE_NO_WINDOW are left out because tools write to our console.
+        """
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+        return {"startupinfo": startupinfo, "creationflags": 0}
+    
+    def _create_batch_pool(self) -> ThreadPoolExecutor:
+        """Create the shared execute_batch pool sized to max_concurrent_jobs."""
+        return ThreadPoolExecutor(
+            max_workers=self.config.max_concurrent_jobs,
+            thread_name_prefix="postcodemon-batch"
+        )
+    
+    def _get_tool_env(self, tool_name: str, tool_config: ToolConfig,
+                      env: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Return the complete child environment for a tool (do not mutate).
+        
+        Built from the os.environ snapshot taken at init or reload_config and
+        passed to the process unchanged, so later os.environ changes are only
+        picked up by reload_config. Only per-call env overrides cost a copy.
+        """
+        tool_env = self._tool_env_cache.get(tool_name)
+        if tool_env is None:
+            tool_env = ProcessManager.build_env(self._env_snapshot, tool_config.environment_vars)
+            self._tool_env_cache[tool_name] = tool_env
+        if env:
+            return ProcessManager.build_env(tool_env, env)
+        return tool_env
+    
+    def validate_arguments(self, tool_name: str, args: List[str],
+                           tool_config: Optional[ToolConfig] = None) -> List[str]:
+        """Validate and transform arguments according to tool configuration.
+        
+        tool_config may be passed when the caller already validated it.
+        """
+        if tool_config is None:
+            tool_config = self.validate_tool_config(tool_name)
         
         # Apply validation rules if configured
         validation_rules = tool_config.validation_rules
         if validation_rules:
+            args_set = set(args)
             for rule_name, rule_config in validation_rules.items():
                 if rule_name == "required_args":
                     required_args = rule_config.get("args", [])
-                    for required_arg in required_args:
-                        if required_arg not in args:
-                            raise ValidationError(
-                                f"Required argument '{required_arg}' missing for tool '{tool_name}'",
-                                field="args",
-                                value=str(args)
-                            )
+                    missing = [arg for arg in required_args if arg not in args_set]
+                    if missing:
+                        missing_str = ", ".join(f"'{arg}'" for arg in missing)
+                        raise ValidationError(
+                            f"Required argument{'s' if len(missing) > 1 else ''} "
+                            f"{missing_str} missing for tool '{tool_name}'",
+                            field="args",
+                            value=str(args)
+                        )
                 
                 elif rule_name == "file_exists":
                     file_arg_indices = rule_config.get("indices", [])
                     for idx in file_arg_indices:
-                        if idx < len(args) and not os.path.exists(args[idx]):
+                        if idx >= len(args):
+                            continue
+                        try:
+                            os.stat(args[idx])
+                        except (OSError, ValueError):
                             raise ValidationError(
                                 f"File does not exist: {args[idx]}",
                                 field="file_path",
@@ -119,10 +353,7 @@ class ToolWrapper:
                             )
         
         # Merge with default arguments
-        final_args = tool_config.default_args.copy()
-        final_args.extend(args)
-        
-        return final_args
+        return [*self._default_args_cache[tool_name], *args]
     
     def execute_tool(self, tool_name: Optional[str] = None, args: Optional[List[str]] = None,
                     cwd: Optional[str] = None, env: Optional[Dict[str, str]] = None,
@@ -159,7 +390,9 @@ class ToolWrapper:
         tool_config = self.validate_tool_config(effective_tool_name)
         
         # Validate and prepare arguments
-        final_args = self.validate_arguments(effective_tool_name, args or [])
+        final_args = self.validate_arguments(
+            effective_tool_name, args or [], tool_config=tool_config
+        )
         
         # Determine timeout
         effective_timeout = timeout or tool_config.timeout_seconds or self.config.global_timeout
@@ -168,17 +401,14 @@ class ToolWrapper:
         effective_cwd = cwd or tool_config.working_directory
         
         # Prepare environment
-        final_env = os.environ.copy()
-        if tool_config.environment_vars:
-            final_env.update(tool_config.environment_vars)
-        if env:
-            final_env.update(env)
+        final_env = self._get_tool_env(effective_tool_name, tool_config, env)
         
-        # Prepare command for logging
-        command_preview = f"{tool_config.executable_path} {' '.join(final_args)}"
+        # Prepare command for logging; only joined if a message needs it
+        command_preview = _LazyJoin([tool_config.executable_path, *final_args])
         
         if dry_run:
-            self.logger.info(f"DRY RUN - Would execute: {command_preview}", extra={
+            command_preview = str(command_preview)
+            self.logger.info("DRY RUN - Would execute: %s", command_preview, extra={
                 'tool_name': effective_tool_name,
                 'args': final_args,
                 'cwd': cwd,
@@ -196,33 +426,64 @@ class ToolWrapper:
                 tool_name=effective_tool_name
             )
         
+        # Shared Windows spawn options, unless the caller passed its own
+        process_kwargs = kwargs
+        win_spawn_kwargs = self._win_spawn_cache.get(effective_tool_name)
+        if win_spawn_kwargs:
+            process_kwargs = {**win_spawn_kwargs, **kwargs}
+        
+        def spawn() -> ProcessResult:
+            return self.process_manager.execute_tool(
+                tool_name=effective_tool_name,
+                executable_path=tool_config.executable_path,
+                args=final_args,
+                timeout=effective_timeout,
+                cwd=effective_cwd,
+                env=final_env,
+                progress_callback=progress_callback,
+                **process_kwargs
+            )
+        
+        return self._run_with_retry(
+            effective_tool_name, tool_config, command_preview, spawn,
+            kwargs.get('cancel_event')
+        )
+    
+    def _run_with_retry(self, tool_name: str, tool_config: ToolConfig,
+                        command_preview: Any, spawn: Callable[[], ProcessResult],
+                        cancel_event: Optional[threading.Event] = None) -> ProcessResult:
+        """Run spawn() with the tool's retry policy, logging and console output."""
         # Execute with retry logic
         last_exception = None
         for attempt in range(tool_config.retry_attempts):
+            if self._shutdown_event.is_set():
+                raise ToolExecutionError(
+                    f"Tool '{tool_name}' not started: wrapper is shutting down",
+                    -1,
+                    "shutdown"
+                )
             try:
-                self.logger.info(f"Executing tool (attempt {attempt + 1}/{tool_config.retry_attempts}): {effective_tool_name}", extra={
-                    'tool_name': effective_tool_name,
-                    'command': command_preview,
-                    'attempt': attempt + 1,
-                    'max_attempts': tool_config.retry_attempts
-                })
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(
+                        "Executing tool (attempt %d/%d): %s",
+                        attempt + 1, tool_config.retry_attempts, tool_name,
+                        extra={
+                            'tool_name': tool_name,
+                            'command': str(command_preview),
+                            'attempt': attempt + 1,
+                            'max_attempts': tool_config.retry_attempts
+                        }
+                    )
                 
                 # Print retry information to console
                 if attempt > 0:
-                    print(f"\n[RETRY {attempt + 1}/{tool_config.retry_attempts}] Retrying tool: {effective_tool_name}")
-                    print(f"Command: {command_preview}")
-                    print("-" * 50)
+                    self._console(
+                        f"\n[RETRY {attempt + 1}/{tool_config.retry_attempts}] Retrying tool: {tool_name}",
+                        f"Command: {command_preview}",
+                        "-" * 50
+                    )
                 
-                result = self.process_manager.execute_tool(
-                    tool_name=effective_tool_name,
-                    executable_path=tool_config.executable_path,
-                    args=final_args,
-                    timeout=effective_timeout,
-                    cwd=effective_cwd,
-                    env=final_env,
-                    progress_callback=progress_callback,
-                    **kwargs
-                )
+                result = spawn()
                 
                 # Check if tool execution was successful
                 if not result.success:
@@ -230,57 +491,68 @@ class ToolWrapper:
                     result.raise_for_status()
                 
                 # Log success
-                self.log_manager.log_audit_event(
-                    "tool_execution_success",
-                    details={
-                        "tool_name": effective_tool_name,
-                        "duration": result.duration,
-                        "return_code": result.return_code,
-                        "attempt": attempt + 1
-                    }
-                )
+                if self.log_manager.is_audit_enabled():
+                    self.log_manager.log_audit_event(
+                        "tool_execution_success",
+                        details={
+                            "tool_name": tool_name,
+                            "duration": result.duration,
+                            "return_code": result.return_code,
+                            "attempt": attempt + 1
+                        }
+                    )
                 
                 # Print success message if retried
                 if attempt > 0:
-                    print(f"\n[SUCCESS] Tool executed successfully after {attempt + 1} retries!")
+                    self._console(f"\n[SUCCESS] Tool executed successfully after {attempt + 1} retries!")
                 
                 return result
                 
             except (ToolExecutionError, ToolNotFoundError) as e:
                 last_exception = e
                 
+                if cancel_event is not None and cancel_event.is_set():
+                    raise
+                
                 if attempt < tool_config.retry_attempts - 1:
                     # Wait before retry (fixed wait time)
                     wait_time = tool_config.retry_wait_seconds
                     self.logger.warning(f"Tool execution failed, retrying in {wait_time}s: {e}", extra={
-                        'tool_name': effective_tool_name,
+                        'tool_name': tool_name,
                         'attempt': attempt + 1,
                         'wait_time': wait_time,
                         'error': str(e)
                     })
                     
                     # Print retry information to console
-                    print(f"\n[ERROR] Attempt {attempt + 1} failed")
-                    print(f"Error: {e}")
-                    print(f"[WAIT] Waiting {wait_time} seconds...")
+                    self._console(
+                        f"\n[ERROR] Attempt {attempt + 1} failed",
+                        f"Error: {e}",
+                        f"[WAIT] Waiting {wait_time} seconds..."
+                    )
                     
-                    time.sleep(wait_time)
+                    if self._wait_before_retry(wait_time, cancel_event):
+                        raise ToolExecutionError(
+                            "shutdown requested during retry backoff", -1, ""
+                        ) from e
                 else:
                     self.logger.error(f"Tool execution failed after {tool_config.retry_attempts} attempts: {e}", extra={
-                        'tool_name': effective_tool_name,
+                        'tool_name': tool_name,
                         'total_attempts': tool_config.retry_attempts,
                         'final_error': str(e)
                     })
                     
                     # Print final failure message
-                    print(f"\n[FAILED] Tool failed after {tool_config.retry_attempts} attempts")
-                    print(f"Final error: {e}")
+                    self._console(
+                        f"\n[FAILED] Tool failed after {tool_config.retry_attempts} attempts",
+                        f"Final error: {e}"
+                    )
                     
                     raise
         
         # If we get here, all retries failed
         raise last_exception or ToolExecutionError(
-            f"Tool '{effective_tool_name}' failed after {tool_config.retry_attempts} attempts",
+            f"Tool '{tool_name}' failed after {tool_config.retry_attempts} attempts",
             -1,
             "Unknown error"
         )
@@ -289,6 +561,7 @@ class ToolWrapper:
                      max_concurrent: Optional[int] = None,
                      fail_fast: bool = False,
                      progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                     progress_thread_safe: bool = False,
                      **kwargs) -> List[ProcessResult]:
         """
         Execute a tool multiple times with different argument sets.
@@ -299,28 +572,75 @@ class ToolWrapper:
             max_concurrent: Maximum concurrent executions (uses config default if None)
             fail_fast: If True, stop on first failure
             progress_callback: Function called with (completed, total, current_command)
+            progress_thread_safe: If True, progress_callback is called from a
+                single dispatcher thread instead of from the worker threads
             **kwargs: Additional arguments passed to execute_tool
             
         Returns:
             List[ProcessResult]: Results for each execution
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        
         effective_concurrent = max_concurrent or self.config.max_concurrent_jobs
-        results = [None] * len(batch_args)
+        # (index, result) pairs in completion order, sorted once at the end
+        indexed_results: List[Tuple[int, ProcessResult]] = []
+        success_count = 0
+        
+        # Set on fail_fast; pending items skip and running tools are terminated
+        cancel_event = threading.Event()
+        
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        if log_info:
+            self.logger.info("Starting batch execution of %d commands", len(batch_args), extra={
+                'tool_name': tool_name,
+                'batch_size': len(batch_args),
+                'max_concurrent': effective_concurrent
+            })
         
-        self.logger.info(f"Starting batch execution of {len(batch_args)} commands", extra={
-            'tool_name': tool_name,
-            'batch_size': len(batch_args),
-            'max_concurrent': effective_concurrent
-        })
+        report_progress = progress_callback
+        dispatcher = None
+        if progress_callback and progress_thread_safe:
+            # Workers append to the deque (atomic) and one thread delivers
+            pending_progress: deque = deque()
+            progress_ready = threading.Event()
+            progress_done = False
+            
+            def dispatch_progress() -> None:
+                while True:
+                    progress_ready.wait()
+                    progress_ready.clear()
+                    while pending_progress:
+                        try:
+                            progress_callback(*pending_progress.popleft())
+                        except Exception as e:
+                            self.logger.error(f"Progress callback failed: {e}")
+                    if progress_done:
+                        break
+            
+            def _queue_progress(completed: int, total: int, command: str) -> None:
+                pending_progress.append((completed, total, command))
+                progress_ready.set()
+            
+            report_progress = _queue_progress
+            
+            dispatcher = threading.Thread(target=dispatch_progress, daemon=True)
+            dispatcher.start()
+        
+        run_item = self._make_batch_runner(tool_name, cancel_event, kwargs)
         
         def execute_single(index_args_pair):
             index, args = index_args_pair
+            if cancel_event.is_set():
+                return index, ProcessResult(
+                    return_code=-2,
+                    stdout="",
+                    stderr="cancelled",
+                    duration=0.0,
+                    command=f"{tool_name} {' '.join(args)}",
+                    tool_name=tool_name
+                )
             try:
-                result = self.execute_tool(tool_name, args, **kwargs)
-                if progress_callback:
-                    progress_callback(index + 1, len(batch_args), result.command)
+                result = run_item(args)
+                if report_progress:
+                    report_progress(index + 1, len(batch_args), result.command)
                 return index, result
             except Exception as e:
                 error_result = ProcessResult(
@@ -333,78 +653,142 @@ class ToolWrapper:
                 )
                 return index, error_result
         
-        with ThreadPoolExecutor(max_workers=effective_concurrent) as executor:
+        # Reuse the shared pool unless the caller asked for other concurrency
+        if effective_concurrent == self.config.max_concurrent_jobs:
+            executor = self._batch_pool
+            scoped_executor = None
+        else:
+            executor = scoped_executor = ThreadPoolExecutor(max_workers=effective_concurrent)
+        
+        try:
             # Submit all tasks
-            future_to_index = {
-                executor.submit(execute_single, (i, args)): i 
+            futures = [
+                executor.submit(execute_single, (i, args))
                 for i, args in enumerate(batch_args)
-            }
+            ]
             
-            completed = 0
-            for future in as_completed(future_to_index):
+            for future in as_completed(futures):
                 try:
                     index, result = future.result()
-                    results[index] = result
-                    completed += 1
+                    indexed_results.append((index, result))
+                    if result.success:
+                        success_count += 1
                     
                     if fail_fast and not result.success:
-                        # Cancel remaining futures
-                        for remaining_future in future_to_index:
-                            if not remaining_future.done():
-                                remaining_future.cancel()
+                        # Stop remaining items and terminate running tools
+                        cancel_event.set()
                         
                         self.logger.error(f"Batch execution failed fast at item {index + 1}", extra={
                             'tool_name': tool_name,
                             'failed_index': index,
-                            'completed': completed,
+                            'completed': len(indexed_results),
                             'total': len(batch_args)
                         })
                         break
                         
                 except Exception as e:
                     self.logger.error(f"Unexpected error in batch execution: {e}")
+            
+            # Let in-flight items observe the cancel event before returning
+            wait(futures)
+        finally:
+            if scoped_executor is not None:
+                scoped_executor.shutdown(wait=True)
+            if dispatcher is not None:
+                progress_done = True
+                progress_ready.set()
+                dispatcher.join()
+        
+        # Results skipped by fail_fast are simply absent
+        indexed_results.sort(key=lambda pair: pair[0])
+        final_results = [result for _, result in indexed_results]
+        
+        if log_info:
+            total = len(final_results)
+            self.logger.info("Batch execution completed: %d/%d successful", success_count, total, extra={
+                'tool_name': tool_name,
+                'successful': success_count,
+                'total': total,
+                'success_rate': success_count / total if total else 0
+            })
         
-        # Filter out None results (from cancelled futures)
-        final_results = [r for r in results if r is not None]
+        return final_results
+    
+    def _make_batch_runner(self, tool_name: str, cancel_event: threading.Event,
+                           kwargs: Dict[str, Any]) -> Callable[[List[str]], ProcessResult]:
+        """Return a per-item runner with everything tool-wide resolved once.
         
-        success_count = sum(1 for r in final_results if r.success)
-        self.logger.info(f"Batch execution completed: {success_count}/{len(final_results)} successful", extra={
-            'tool_name': tool_name,
-            'successful': success_count,
-            'total': len(final_results),
-            'success_rate': success_count / len(final_results) if final_results else 0
-        })
+        Config, timeout, cwd, environment and spawn options are the same for
+        every item of a batch, so only argument validation runs per item.
+        Dry runs and unknown tools use the generic execute_tool path.
+        """
+        def run_generic(args: List[str]) -> ProcessResult:
+            return self.execute_tool(tool_name, args, cancel_event=cancel_event, **kwargs)
         
-        return final_results
+        if kwargs.get('dry_run'):
+            return run_generic
+        try:
+            tool_config = self.validate_tool_config(tool_name)
+        except ConfigurationError:
+            return run_generic
+        
+        process_kwargs = dict(kwargs)
+        process_kwargs.pop('dry_run', None)
+        timeout = process_kwargs.pop('timeout', None)
+        cwd = process_kwargs.pop('cwd', None)
+        env = process_kwargs.pop('env', None)
+        
+        effective_timeout = timeout or tool_config.timeout_seconds or self.config.global_timeout
+        effective_cwd = cwd or tool_config.working_directory
+        final_env = self._get_tool_env(tool_name, tool_config, env)
+        process_kwargs = {
+            **self._win_spawn_cache.get(tool_name, {}),
+            **process_kwargs,
+            'cancel_event': cancel_event
+        }
+        executable_path = tool_config.executable_path
+        
+        def run_item(args: List[str]) -> ProcessResult:
+            final_args = self.validate_arguments(tool_name, args, tool_config=tool_config)
+            
+            def spawn() -> ProcessResult:
+                return self.process_manager.execute_tool(
+                    tool_name=tool_name,
+                    executable_path=executable_path,
+                    args=final_args,
+                    timeout=effective_timeout,
+                    cwd=effective_cwd,
+                    env=final_env,
+                    **process_kwargs
+                )
+            
+            command_preview = _LazyJoin([executable_path, *final_args])
+            return self._run_with_retry(
+                tool_name, tool_config, command_preview, spawn, cancel_event
+            )
+        
+        return run_item
     
-    def get_tool_info(self, tool_name: Optional[str] = None) -> Dict[str, Any]:
-        """Get information about a configured tool."""
+    def get_tool_info(self, tool_name: Optional[str] = None,
+                      refresh: bool = False) -> Dict[str, Any]:
+        """Get information about a configured tool.
+        
+        Results are cached until reload_config; pass refresh=True to re-probe.
+        """
         effective_tool_name = tool_name or self.tool_name
         if not effective_tool_name:
             raise ConfigurationError("No tool name provided")
         
+        if not refresh:
+            cached = self._tool_info_cache.get(effective_tool_name)
+            if cached is not None:
+                return dict(cached)
+        
         tool_config = self.validate_tool_config(effective_tool_name)
         
-        # Try to get version info by running the tool
-        version_info = None
-        try:
-            # Common version flags
-            for version_flag in ["--version", "-v", "/version", "/?", "--help"]:
-                try:
-                    result = self.execute_tool(
-                        effective_tool_name, 
-                        [version_flag], 
-                        timeout=10
-                    )
-                    if result.success and (result.stdout or result.stderr):
-                        version_info = (result.stdout or result.stderr).strip()[:200]
-                        break
-                except:
-                    continue
-        except:
-            pass
+        version_info = self._probe_version_info(effective_tool_name, tool_config)
         
-        return {
+        tool_info = {
             'name': effective_tool_name,
             'executable_path': tool_config.executable_path,
             'executable_exists': os.path.isfile(tool_config.executable_path),
@@ -415,20 +799,73 @@ class ToolWrapper:
             'validation_rules': tool_config.validation_rules,
             'version_info': version_info
         }
+        self._tool_info_cache[effective_tool_name] = tool_info
+        
+        return dict(tool_info)
+    
+    def _probe_version_info(self, tool_name: str, tool_config: ToolConfig) -> Optional[str]:
+        """Find the tool's version text with as few spawns as possible.
+        
+        A version_flag pinned in the config (or one that worked before) is
+        tried alone. Otherwise the common flags are tried one at a time in
+        priority order, --version first with a short timeout. Each probe is a
+        single attempt, without the retry policy or console banners, and its
+        output is captured rather than echoed to the console.
+        """
+        def probe(version_flag: str, timeout: int = 10) -> Optional[str]:
+            try:
+                result = self.process_manager.execute_tool(
+                    tool_name=tool_name,
+                    executable_path=tool_config.executable_path,
+                    args=self.validate_arguments(tool_name, [version_flag], tool_config=tool_config),
+                    timeout=timeout,
+                    cwd=tool_config.working_directory,
+                    env=self._get_tool_env(tool_name, tool_config),
+                    progress_callback=lambda line: None,
+                    **self._win_spawn_cache.get(tool_name, {})
+                )
+            except Exception:
+                return None
+            if result.success and (result.stdout or result.stderr):
+                return (result.stdout or result.stderr).strip()[:200]
+            return None
+        
+        known_flag = tool_config.version_flag or self._version_flags.get(tool_name)
+        if known_flag:
+            version_info = probe(known_flag)
+            if version_info or tool_config.version_flag:
+                return version_info
+        
+        for version_flag, timeout in (("--version", 2), ("-v", 10), ("/version", 10),
+                                      ("/?", 10), ("--help", 10)):
+            if self._shutdown_event.is_set():
+                return None
+            version_info = probe(version_flag, timeout)
+            if version_info:
+                self._version_flags[tool_name] = version_flag
+                return version_info
+        return None
     
-    def list_tools(self) -> Dict[str, Dict[str, Any]]:
+    def list_tools(self, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
         """List all configured tools with their information."""
-        tools_info = {}
-        for tool_name in self.config.tools.keys():
+        
+        def tool_info(tool_name: str) -> Dict[str, Any]:
             try:
-                tools_info[tool_name] = self.get_tool_info(tool_name)
+                return self.get_tool_info(tool_name, refresh=refresh)
             except Exception as e:
-                tools_info[tool_name] = {
+                return {
                     'name': tool_name,
                     'error': str(e)
                 }
         
-        return tools_info
+        tool_names = list(self.config.tools.keys())
+        if not tool_names:
+            return {}
+        
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(tool_names), self.config.max_concurrent_jobs))
+        ) as executor:
+            return dict(zip(tool_names, executor.map(tool_info, tool_names)))
     
     def get_active_processes(self) -> Dict[str, Dict[str, Any]]:
         """Get information about currently running processes."""
@@ -440,8 +877,20 @@ class ToolWrapper:
     
     def reload_config(self) -> None:
         """Reload configuration from files."""
+        previous_concurrent = self.config.max_concurrent_jobs
         self.config_manager._config = None  # Clear cached config
         self.config = self.config_manager.load_config()
+        self._tool_configs = dict(self.config.tools)
+        self._tool_names_list = list(self._tool_configs)
+        if self.config.max_concurrent_jobs != previous_concurrent:
+            self._batch_pool.shutdown(wait=False)
+            self._batch_pool = self._create_batch_pool()
+        self._env_snapshot = dict(os.environ)
+        self._tool_env_cache.clear()
+        self._tool_info_cache.clear()
+        self._version_flags.clear()
+        self._default_args_cache.clear()
+        self._win_spawn_cache.clear()
         self.log_manager.update_config(self.config.logging)
         
         self.logger.info("Configuration reloaded", extra={
@@ -450,19 +899,61 @@ class ToolWrapper:
         })
     
     def shutdown(self) -> None:
-        """Shutdown the wrapper and clean up resources."""
-        self.logger.info("Shutting down PostCodeMon wrapper")
+        """Shutdown the wrapper and clean up resources.
         
-        try:
-            # Shutdown process manager
-            self.process_manager.shutdown()
+        Safe to call more than once and from several threads; only the first
+        call does the work, later ones wait for it to finish.
+        """
+        # A signal-driven shutdown is finished by the reaper thread; let it
+        # complete rather than racing it to interpreter exit
+        if self._last_signal is not None and threading.current_thread() is not self._reaper:
+            self._reaper.join()
+        
+        with self._shutdown_lock:
+            if self._shutdown_done:
+                return
+            self._shutdown_done = True
+            if self._last_signal is None:
+                # Kept for signal shutdowns, so an exiting main thread still
+                # waits for the reaper to finish tearing down
+                atexit.unregister(self._atexit_callback)
             
-            # Shutdown logging
-            self.log_manager.shutdown()
+            self.logger.info("Shutting down PostCodeMon wrapper")
+            
+            # Wake any retry backoff and refuse further attempts
+            self._shutdown_event.set()
+            
+            try:
+                # Drop queued batch items before tearing down the process manager
+                if sys.version_info >= (3, 9):
+                    self._batch_pool.shutdown(wait=False, cancel_futures=True)
+                else:
+                    self._batch_pool.shutdown(wait=False)
+            
+                # Shutdown process manager
+                self.process_manager.shutdown()
+            
+                # Shutdown logging
+                self.log_manager.shutdown()
+            
+            except Exception as e:
+                print(f"Error during shutdown: {e}", file=sys.stderr)
+            
+            # Flush pending console messages
+            if self._console_thread.is_alive():
+                self._console_queue.put(None)
+                self._console_thread.join(timeout=5.0)
+            
+            # Release the idle reaper thread, then the signal handlers and the
+            # pipe they write to (handlers first, so no signal can race the close)
+            if threading.current_thread() is not self._reaper:
+                if self._last_signal is None:
+                    os.write(self._wakeup_w, b"\0")
+                    self._reaper.join(timeout=1.0)
+                self._restore_signal_handlers()
+            
+            self._shutdown_finished = True
             
-        except Exception as e:
-            print(f"Error during shutdown: {e}", file=sys.stderr)
-    
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -1,6 +1,7 @@
 """Setup configuration for PostCodeMon."""
 
-from setuptools import setup, find_packages
+import re
+from setuptools import setup
 from pathlib import Path
 
 # Read the README file
@@ -9,12 +10,8 @@ long_description = readme_path.read_text(encoding="utf-8") if readme_path.exists
 
 # Read requirements
 requirements_path = Path(__file__).parent / "requirements.txt"
-with open(requirements_path, encoding="utf-8") as f:
-    requirements = [
-        line.strip() 
-        for line in f 
-        if line.strip() and not line.startswith("#") and not line.startswith("-e")
-    ]
+_REQUIREMENT_RE = re.compile(r"^[ \t]*(?!#|-e)(\S(?:.*\S)?)[ \t]*$", re.MULTILINE)
+requirements = _REQUIREMENT_RE.findall(requirements_path.read_text(encoding="utf-8"))
 
 setup(
     name="PostCodeMon",
@@ -25,7 +22,10 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/example/postcodemon",
-    packages=find_packages(include=['PostCodeMon', 'PostCodeMon.*']),
+    # The package sources live next to this file, so map them explicitly
+    # instead of walking the tree with find_packages().
+    package_dir={"PostCodeMon": "."},
+    packages=["PostCodeMon", "PostCodeMon.cli", "PostCodeMon.core"],
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -8,6 +8,9 @@ setup(
         "pandas>=2.0.0",
         "openpyxl>=3.1.0",
     ],
+    extras_require={
+        "calamine": ["pandas>=2.2.0", "python-calamine>=0.2"],
+    },
     entry_points={
         'console_scripts': [
             'generate_header=src.main:main',
@@ -1,8 +1,28 @@
 import pandas as pd
 from typing import Tuple, List
+import hashlib
 import os
 from ..utils.validators import DQMapValidator
 
+# 有安裝 python-calamine 且 pandas >= 2.2（才支援 calamine 引擎）時改用原生的 calamine 引擎解析 xlsx，
+# 否則沿用 pandas 預設的 openpyxl
+try:
+    import python_calamine  # noqa: F401
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+_PANDAS_VERSION = tuple(int(part) for part in pd.__version__.split(".")[:2])
+_EXCEL_ENGINE = "calamine" if _HAS_CALAMINE and _PANDAS_VERSION >= (2, 2) else None
+
+# 解析結果的磁碟快取目錄，每個 Excel 檔案對應一個 pickle 檔
+_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "dq_map"
+)
+
+# PIN 編號的合法範圍 0x00 ~ 0x1F（名稱最後兩個十六進位字元）
+_VALID_PIN_NUMBERS = frozenset(f"{i:02X}" for i in range(0x20))
+
 class DQMapReader:
     """DQ Map Excel 檔案讀取器"""
     
@@ -17,12 +37,42 @@ class DQMapReader:
             if not self._validate_file_exists():
                 return False, ["檔案不存在"]
                 
-            self.data = pd.read_excel(self.file_path)
+            self.data = self._read_workbook()
             return self._validate_data()
             
         except Exception as e:
             return False, [f"錯誤：{str(e)}"]
 
+    def _read_workbook(self) -> pd.DataFrame:
+        """讀取 Excel 檔案，檔案未變更時重用磁碟快取中先前解析的結果
+        
+        快取以 (絕對路徑, mtime_ns, 檔案大小) 判斷是否有效；每個路徑只保留
+        最新的一份，檔案修改後會直接覆寫，不會累積舊資料。
+        """
+        abs_path = os.path.abspath(self.file_path)
+        stat = os.stat(abs_path)
+        cache_key = (abs_path, stat.st_mtime_ns, stat.st_size)
+        cache_path = os.path.join(
+            _CACHE_DIR, hashlib.sha1(abs_path.encode("utf-8")).hexdigest() + ".pkl"
+        )
+
+        try:
+            cached_key, cached_data = pd.read_pickle(cache_path)
+            if cached_key == cache_key:
+                return cached_data
+        except Exception:
+            pass  # 快取不存在或已損毀時重新解析
+
+        data = pd.read_excel(abs_path, engine=_EXCEL_ENGINE)
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            pd.to_pickle((cache_key, data), temp_path)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            pass  # 快取目錄無法寫入時仍回傳解析結果
+        return data
+
     def _validate_file_exists(self) -> bool:
         """驗證檔案是否存在"""
         return os.path.exists(self.file_path)
@@ -37,15 +87,23 @@ class DQMapReader:
         if missing_columns:
             errors.append(f"缺少必要欄位：{', '.join(missing_columns)}")
 
-        # 檢查數據值
-        for col in self.data.columns:
-            for idx, value in enumerate(self.data[col]):
-                if pd.isna(value):
-                    errors.append(f"第 {idx+1} 行的 {col} 包含空值")
-                elif not self.validator.validate_pin_name(str(value)):
-                    errors.append(f"第 {idx+1} 行的 {col} 格式錯誤：{value}")
-                elif not self.validator.validate_pin_number(str(value)):
-                    errors.append(f"第 {idx+1} 行的 {col} PIN 編號超出範圍：{value}")
+        # 檢查數據值：依「欄、列」順序把整張表展開成單一 Series，一次完成空值、格式與範圍檢查，
+        # 只對有問題的儲存格逐一產生訊息
+        cells = self.data.astype(object).reset_index(drop=True).unstack()
+        is_na = cells.isna()
+        text = cells.astype(str)
+        name_ok = text.str.match(self.validator.valid_pin_pattern.pattern, na=False) & ~is_na
+        number_ok = name_ok & text.str[-2:].isin(_VALID_PIN_NUMBERS)
+
+        bad = ~number_ok
+        for (col, idx), value, na, name_valid in zip(
+                cells.index[bad], cells[bad], is_na[bad], name_ok[bad]):
+            if na:
+                errors.append(f"第 {idx+1} 行的 {col} 包含空值")
+            elif not name_valid:
+                errors.append(f"第 {idx+1} 行的 {col} 格式錯誤：{value}")
+            else:
+                errors.append(f"第 {idx+1} 行的 {col} PIN 編號超出範圍：{value}")
 
         return (len(errors) == 0, errors)
 
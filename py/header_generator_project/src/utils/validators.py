@@ -1,30 +1,34 @@
 import re
 from typing import List, Union
 
+_HEX_DIGITS = '0123456789ABCDEF'
+_PIN_RE = re.compile(r'^M[A-D][0-1]_DQ_[0-9A-F]{2}\Z')
+_DRAM_GROUPS = ('MA', 'MB', 'MC', 'MD')
+
 class DQMapValidator:
     """DQ Map 資料驗證器"""
     
-    def __init__(self):
-        self.dram_groups = ['MA', 'MB', 'MC', 'MD']
-        self.valid_pin_pattern = re.compile(r'^[M][A-D][0-1]_DQ_[0-9A-F]{2}$')
+    # 必要欄位固定為 DQ_00_A ~ DQ_15_A、DQ_00_B ~ DQ_15_B，只在載入時建立一次
+    REQUIRED_COLUMNS = tuple(f"DQ_{i:02d}_{side}" for side in 'AB' for i in range(16))
+    
+    # 所有實例共用同一份 DRAM 群組與已編譯的 PIN 名稱樣式
+    dram_groups = _DRAM_GROUPS
+    valid_pin_pattern = _PIN_RE
 
     def validate_pin_name(self, pin_name: str) -> bool:
         """驗證 PIN 名稱格式"""
-        if not isinstance(pin_name, str):
-            return False
-        return bool(self.valid_pin_pattern.match(pin_name))
+        # 格式固定為 9 個字元（M[A-D][0-1]_DQ_XX），直接逐字比對，不經過 regex
+        return (isinstance(pin_name, str) and len(pin_name) == 9
+                and pin_name[0] == 'M' and 'A' <= pin_name[1] <= 'D'
+                and pin_name[2] in '01' and pin_name[3:7] == '_DQ_'
+                and pin_name[7] in _HEX_DIGITS and pin_name[8] in _HEX_DIGITS)
 
     def validate_pin_number(self, pin_name: str) -> bool:
         """驗證 PIN 編號範圍"""
         if not self.validate_pin_name(pin_name):
             return False
-        pin_num = pin_name.split('_')[-1]
-        return 0x00 <= int(pin_num, 16) <= 0x1F
+        return int(pin_name[-2:], 16) <= 0x1F
 
     def get_required_columns(self) -> List[str]:
         """獲取必要的欄位名稱列表"""
-        columns = []
-        for side in ['A', 'B']:
-            for i in range(16):
-                columns.append(f"DQ_{i:02d}_{side}")
-        return columns
\ No newline at end of file
+        return list(self.REQUIRED_COLUMNS)
\ No newline at end of file